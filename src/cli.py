@@ -205,6 +205,8 @@ def main():
     except Exception as e:
         print(f"\nError during upload: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        service_factory.shutdown()
 
 if __name__ == "__main__":
     main()
@@ -6,10 +6,19 @@ enabling better modularity, testing, and maintainability.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Callable, Protocol
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, Protocol, Union
 from pathlib import Path
 
 
+@dataclass(slots=True, frozen=True)
+class FileInfo:
+    """A validated upload file, described once and passed down the upload pipeline"""
+    path: Path
+    size: int
+    mtime_ns: int
+
+
 class ProgressCallback(Protocol):
     """Protocol for progress reporting callbacks"""
     def __call__(self, percentage: int) -> None:
@@ -39,6 +48,20 @@ class FileValidator(ABC):
             Tuple of (is_valid, error_message)
         """
         pass
+    
+    @abstractmethod
+    def validate_and_describe(self, file_path: str) -> tuple[Optional[FileInfo], Optional[str]]:
+        """
+        Validate a file for upload and describe it
+        
+        Args:
+            file_path: Path to the file to validate
+            
+        Returns:
+            Tuple of (file_info, error_message); file_info is None if the
+            file is invalid
+        """
+        pass
 
 
 class MetadataValidator(ABC):
@@ -106,9 +129,14 @@ class RepositoryAPI(ABC):
         pass
     
     @abstractmethod
-    def upload_file(self, deposition_id: int, file_path: str, 
+    def upload_file(self, deposition_id: int, file_path: Union[str, FileInfo], 
                    progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
-        """Upload a file to a deposition"""
+        """Upload a file (a path, or a FileInfo from validate_and_describe) to a deposition"""
+        pass
+    
+    @abstractmethod
+    def get_deposition(self, deposition_id: int) -> Dict[str, Any]:
+        """Get an existing deposition"""
         pass
     
     @abstractmethod
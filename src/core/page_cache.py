@@ -0,0 +1,35 @@
+"""
+Page cache hints for files that are streamed once
+
+Uploading or checksumming a multi-GB file would otherwise push everything
+else out of the OS page cache. All hints are advisory; platforms without
+them are left alone.
+"""
+
+import os
+import sys
+
+# Files at least this large are streamed past the page cache: they would
+# only evict hotter pages and are unlikely to still be cached when read again
+STREAM_UNCACHED_MIN_SIZE = 1 << 30
+
+
+def advise_streaming(fd: int) -> None:
+    """Hint that fd is read once, sequentially, and need not stay in the page cache"""
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        elif sys.platform == 'darwin':
+            import fcntl
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+    except OSError:
+        pass  # Advisory only
+
+
+def drop_cached_pages(fd: int) -> None:
+    """Ask the kernel to evict fd's pages from the page cache (Linux)"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
@@ -19,11 +19,11 @@ import json
 
 from .widgets import QCollapsibleBox, CreatorWidget, ContributorWidget
 from .upload_worker import ModularUploadWorker
+from .zip_worker import ZipWorker
 from .template_loader import populate_gui_from_template
 from .multi_column_params import MultiColumnParametersWidget
 from ..services import get_service_factory
 from ..services.metadata import Creator, Contributor, EDParameters, ZenodoMetadata, Funding
-from ..services.file_packing import create_zip_from_folder
 from ..services.metadata_validation import ZenodoMetadataValidator
 from ..services.user_config import (
     get_settings_file_path, load_settings, save_settings,
@@ -91,6 +91,7 @@ class ZenodoUploaderApp(QMainWindow):
         self.creators_list = []
         self.contributors_list = []
         self.upload_worker = None  # Track upload worker
+        self.zip_worker = None  # Track ZIP worker
         # Guard used to avoid re-entrant UI updates while loading metadata
         self._loading_metadata = False
         
@@ -190,7 +191,8 @@ class ZenodoUploaderApp(QMainWindow):
     def closeEvent(self, event):
         """Handle application close event"""
         # Check if upload is in progress
-        if hasattr(self, 'upload_worker') and self.upload_worker and self.upload_worker.isRunning():
+        upload_running = hasattr(self, 'upload_worker') and self.upload_worker and self.upload_worker.isRunning()
+        if upload_running:
             reply = QMessageBox.question(
                 self, 
                 'Upload in Progress',
@@ -199,20 +201,53 @@ class ZenodoUploaderApp(QMainWindow):
                 QMessageBox.StandardButton.No
             )
             
-            if reply == QMessageBox.StandardButton.Yes:
-                # Cancel upload and wait for it to finish
-                self.status_label.setText("Cancelling upload before exit...")
-                self.upload_worker.cancel()
-                if not self.upload_worker.wait(5000):  # Wait up to 5 seconds
-                    self.upload_worker.terminate()
-                    self.upload_worker.wait()
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            # Save settings before closing
-            self.save_settings()
-            event.accept()
+                return
+        
+        # Check if a ZIP file is being created
+        zip_running = self.zip_worker is not None and self.zip_worker.isRunning()
+        if zip_running:
+            reply = QMessageBox.question(
+                self, 
+                'ZIP Creation in Progress',
+                'A ZIP file is currently being created. Do you want to cancel it and exit?',
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        
+        if upload_running:
+            # Cancel upload and wait for it to finish
+            self.status_label.setText("Cancelling upload before exit...")
+            self.upload_worker.cancel()
+            if not self.upload_worker.wait(5000):  # Wait up to 5 seconds
+                self.upload_worker.terminate()
+                self.upload_worker.wait()
+        
+        if zip_running:
+            self._stop_zip_worker()
+        
+        # Save settings before closing
+        self.save_settings()
+        self.service_factory.shutdown()
+        event.accept()
+    
+    def _stop_zip_worker(self):
+        """Cancel the ZIP worker, wait for it and remove its partial ZIP file"""
+        worker = self.zip_worker
+        worker.cancel()
+        if not worker.wait(5000):  # Wait up to 5 seconds
+            worker.terminate()
+            worker.wait()
+        if worker.created_path is None:
+            try:
+                os.remove(worker.zip_path)
+            except OSError:
+                pass
         
     def load_settings(self):
         """Load saved settings"""
@@ -1071,13 +1106,31 @@ class ZenodoUploaderApp(QMainWindow):
         if not zip_path:
             return
         
-        try:
-            zip_path = create_zip_from_folder(folder_path, zip_path)
-            self.file_path_edit.setPlainText(zip_path)
-            QMessageBox.information(self, "Success", f"ZIP file created successfully:\n{zip_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to create ZIP file:\n{str(e)}")
+        # Archiving can take a while, so keep the GUI responsive meanwhile
+        self.create_zip_button.setEnabled(False)
+        self.create_zip_button.setText("Creating ZIP...")
+        self.zip_worker = ZipWorker(folder_path, zip_path)
+        self.zip_worker.zip_completed.connect(self.on_zip_completed)
+        self.zip_worker.zip_failed.connect(self.on_zip_failed)
+        self.zip_worker.finished.connect(self.on_zip_finished)
+        self.zip_worker.start()
+    
+    def on_zip_completed(self, zip_path: str):
+        """Handle a successfully created ZIP file"""
+        self.file_path_edit.setPlainText(zip_path)
+        QMessageBox.information(self, "Success", f"ZIP file created successfully:\n{zip_path}")
+    
+    def on_zip_failed(self, error_message: str):
+        """Handle a failure to create the ZIP file"""
+        QMessageBox.critical(self, "Error", f"Failed to create ZIP file:\n{error_message}")
+    
+    def on_zip_finished(self):
+        """Clean up after the ZIP worker thread finished"""
+        self.create_zip_button.setEnabled(True)
+        self.create_zip_button.setText("Create ZIP from Folder...")
+        if self.zip_worker:
+            self.zip_worker.deleteLater()
+        self.zip_worker = None
     
     def get_metadata(self) -> Dict[str, Any]:
         """Extract metadata from the form"""
@@ -1397,11 +1450,6 @@ class ZenodoUploaderApp(QMainWindow):
         msg_box.exec()
         QMessageBox.critical(self, "Upload Failed", f"Failed to upload:\n{error_message}")
     
-    def closeEvent(self, a0):
-        """Handle application close"""
-        self.save_settings()
-        super().closeEvent(a0)
-    
     def reset_metadata(self):
         """Reset all metadata fields to their default values using the clean template system"""
         # Ask for confirmation
@@ -15,7 +15,7 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
     QSizePolicy, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QColor
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
@@ -24,6 +24,33 @@ import os
 from .widgets import QCollapsibleBox
 
 
+class CifParseSignals(QObject):
+    """Signals for CifParseTask (QRunnable is not a QObject and cannot emit)"""
+    
+    parsed = pyqtSignal(int, str, object)  # index, filepath, parameters dict
+    failed = pyqtSignal(int, str, str)  # index, filepath, error message
+
+
+class CifParseTask(QRunnable):
+    """Parse one CIF file on the global thread pool and report the extracted parameters"""
+    
+    def __init__(self, index: int, filepath: str, signals: CifParseSignals):
+        super().__init__()
+        self.index = index
+        self.filepath = filepath
+        self.signals = signals
+    
+    def run(self):
+        from ..services.cif_parser import CIFParser, extract_parameters_from_cif
+        
+        try:
+            parameters = extract_parameters_from_cif(CIFParser().parse_file(self.filepath))
+        except Exception as e:
+            self.signals.failed.emit(self.index, self.filepath, str(e))
+            return
+        self.signals.parsed.emit(self.index, self.filepath, parameters)
+
+
 class MultiColumnParametersWidget(QWidget):
     """
     Widget for managing measurement parameters with support for multiple CIF files.
@@ -416,8 +443,6 @@ class MultiColumnParametersWidget(QWidget):
         (as defined by the template). CIF fields not matching existing parameters
         are silently ignored to keep the table structure consistent with the template.
         """
-        from ..services.cif_parser import CIFParser, extract_parameters_from_cif
-        
         filepaths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select CIF Files",
@@ -428,34 +453,67 @@ class MultiColumnParametersWidget(QWidget):
         if not filepaths:
             return
         
-        parser = CIFParser()
-        imported_count = 0
+        # Parse on the shared thread pool; results are delivered to the GUI
+        # thread through queued signals and applied once all files are done
+        self.import_cif_btn.setEnabled(False)
+        self._cif_results = [None] * len(filepaths)  # (filepath, parameters, error) per file
+        self._cif_pending = len(filepaths)
         
-        for filepath in filepaths:
-            try:
-                cif_data = parser.parse_file(filepath)
-                parameters = extract_parameters_from_cif(cif_data)
-                
-                # Create column name from filename
-                filename = Path(filepath).stem
-                
-                # Collect values for this CIF - only for parameters already in the table
-                values_dict = {}
-                for param_name, (value, section) in parameters.items():
-                    # Only include if parameter already exists in table
-                    if param_name in self.parameter_rows:
-                        values_dict[param_name] = value
-                
-                # Add column with values
-                self.add_column(filename, values_dict)
-                imported_count += 1
-                
-            except Exception as e:
+        signals = CifParseSignals(self)
+        signals.parsed.connect(self._on_cif_parsed)
+        signals.failed.connect(self._on_cif_failed)
+        self._cif_signals = signals
+        
+        pool = QThreadPool.globalInstance()
+        for index, filepath in enumerate(filepaths):
+            pool.start(CifParseTask(index, filepath, signals))
+    
+    @pyqtSlot(int, str, object)
+    def _on_cif_parsed(self, index: int, filepath: str, parameters: object):
+        self._cif_results[index] = (filepath, parameters, None)
+        self._finish_cif_task()
+    
+    @pyqtSlot(int, str, str)
+    def _on_cif_failed(self, index: int, filepath: str, error: str):
+        self._cif_results[index] = (filepath, None, error)
+        self._finish_cif_task()
+    
+    def _finish_cif_task(self):
+        """Count a finished parse task and apply all results after the last one"""
+        self._cif_pending -= 1
+        if self._cif_pending > 0:
+            return
+        
+        results = self._cif_results
+        self._cif_results = []
+        self._cif_signals.deleteLater()
+        self._cif_signals = None
+        self.import_cif_btn.setEnabled(True)
+        
+        # Apply in the order the files were selected
+        imported_count = 0
+        for filepath, parameters, error in results:
+            if error is not None:
                 QMessageBox.warning(
                     self,
                     "Import Error",
-                    f"Failed to import {Path(filepath).name}:\n{str(e)}"
+                    f"Failed to import {Path(filepath).name}:\n{error}"
                 )
+                continue
+            
+            # Create column name from filename
+            filename = Path(filepath).stem
+            
+            # Collect values for this CIF - only for parameters already in the table
+            values_dict = {}
+            for param_name, (value, section) in parameters.items():
+                # Only include if parameter already exists in table
+                if param_name in self.parameter_rows:
+                    values_dict[param_name] = value
+            
+            # Add column with values
+            self.add_column(filename, values_dict)
+            imported_count += 1
         
         if imported_count > 0:
             QMessageBox.information(
@@ -5,6 +5,8 @@ This module provides methods to populate the GUI from template data
 without triggering cascading signal handlers.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtCore import QDate
 from PyQt6.QtWidgets import QWidget
 
@@ -145,7 +147,7 @@ def _populate_creators(gui_app, creators) -> None:
         
         # Create container with remove button
         container = QWidget()
-        container_layout = QVBoxLayout()
+        container_layout = QVBoxLayout(container)
         container_layout.addWidget(creator_widget)
         
         remove_layout = QHBoxLayout()
@@ -155,7 +157,6 @@ def _populate_creators(gui_app, creators) -> None:
         remove_layout.addStretch()
         remove_layout.addWidget(remove_btn)
         container_layout.addLayout(remove_layout)
-        container.setLayout(container_layout)
         
         # Add to GUI
         gui_app.creators_list.append(creator_widget)
@@ -190,7 +191,7 @@ def _populate_contributors(gui_app, contributors) -> None:
         
         # Create container with remove button
         container = QWidget()
-        container_layout = QVBoxLayout()
+        container_layout = QVBoxLayout(container)
         container_layout.addWidget(contributor_widget)
         
         remove_layout = QHBoxLayout()
@@ -200,7 +201,6 @@ def _populate_contributors(gui_app, contributors) -> None:
         remove_layout.addStretch()
         remove_layout.addWidget(remove_btn)
         container_layout.addLayout(remove_layout)
-        container.setLayout(container_layout)
         
         # Add to GUI
         gui_app.contributors_list.append(contributor_widget)
@@ -213,7 +213,7 @@ def _populate_funding(gui_app, grants) -> None:
     
     for grant_data in grants:
         container = QWidget()
-        container_layout = QFormLayout()
+        container_layout = QFormLayout(container)
         
         funder_edit = QLineEdit()
         funder_edit.setText(getattr(grant_data, 'funder', ''))
@@ -236,7 +236,6 @@ def _populate_funding(gui_app, grants) -> None:
         container_layout.addRow("URL:", url_edit)
         container_layout.addRow("", remove_btn)
         
-        container.setLayout(container_layout)
         container.setProperty('funder_edit', funder_edit)
         container.setProperty('award_number_edit', award_number_edit)
         container.setProperty('award_title_edit', award_title_edit)
@@ -260,7 +259,7 @@ def _populate_communities(gui_app, communities) -> None:
     
     for community_data in communities:
         container = QWidget()
-        container_layout = QHBoxLayout()
+        container_layout = QHBoxLayout(container)
         
         community_name = QLineEdit()
         community_name.setPlaceholderText("Community identifier")
@@ -272,7 +271,6 @@ def _populate_communities(gui_app, communities) -> None:
         
         container_layout.addWidget(community_name)
         container_layout.addWidget(remove_btn)
-        container.setLayout(container_layout)
         
         gui_app.communities_layout.addWidget(container)
         gui_app.communities_list.append(community_name)
@@ -282,66 +280,75 @@ def _populate_communities(gui_app, communities) -> None:
             remove_btn.hide()
 
 
-def _get_smart_section(parameter_name: str) -> str:
-    """
-    Automatically assign section based on parameter name
-    """
-    param_lower = parameter_name.lower()
-    
+# Keywords used for automatic section assignment, in priority order
+# (earlier sections win when a parameter name matches several keywords)
+_SECTION_KEYWORDS = (
     # General information
-    general_keywords = [
+    ("General", (
         'collection site', 'sample label', 'crystal structure deposit', 
         'data availability', 'deposit', 'site', 'label'
-    ]
-    
+    )),
     # Instrumental parameters
-    instrumental_keywords = [
+    ("Instrumental", (
         'instrument', 'radiation source', 'voltage', 'wavelength', 'probe type',
         'beam', 'detector', 'pixel', 'binning', 'source', 'accelerating'
-    ]
-    
+    )),
     # Sample description
-    sample_keywords = [
+    ("Sample description", (
         'name', 'chemical composition', 'molecular weight', 'sample source',
         'grid', 'sample preparation', 'sample holder', 'crystal size',
         'crystal morphology', 'composition', 'preparation', 'holder', 'morphology'
-    ]
-    
-    # Software & Files parameters (check first for priority)
-    software_keywords = [
-        'software for data collection', 'software for data processing', 'software for',
-        'crystalispro', 'data processing software', 'collection software',
-        'software', 'processing', 'image', 'file', 'files', 'format', 'program'
-    ]
-
+    )),
     # Experimental parameters
-    experimental_keywords = [
+    ("Experimental", (
         'data type', 'data collection method', 'temperature', 'rotation',
         'exposure time', 'frames', 'resolution', 'completeness', 'multiplicity',
         'crystal system', 'space group', 'unit cell', 'method',
-    ]
-    
-    # Check other categories
-    for keyword in general_keywords:
-        if keyword in param_lower:
-            return "General"
-    
-    for keyword in instrumental_keywords:
-        if keyword in param_lower:
-            return "Instrumental"
+    )),
+    # Software & Files parameters
+    ("Software & Files", (
+        'software for data collection', 'software for data processing', 'software for',
+        'crystalispro', 'data processing software', 'collection software',
+        'software', 'processing', 'image', 'file', 'files', 'format', 'program'
+    )),
+)
+
+
+def _build_keyword_index() -> dict:
+    """Bucket keywords by first character as {char: [(rank, keyword, section)]}"""
+    index = {}
+    rank = 0
+    for section, keywords in _SECTION_KEYWORDS:
+        for keyword in keywords:
+            index.setdefault(keyword[0], []).append((rank, keyword, section))
+            rank += 1
+    return index
+
+
+# Buckets are in rank order, so the first hit in a bucket is its best match
+_KW_BY_FIRST = _build_keyword_index()
+
+
+@lru_cache(maxsize=512)
+def _get_smart_section(parameter_name: str) -> str:
+    """
+    Automatically assign section based on parameter name
     
-    for keyword in sample_keywords:
-        if keyword in param_lower:
-            return "Sample description"
+    Cached: parameter names come from a small, recurring set and the result
+    only depends on the name, so repeated table previews are lookups.
+    """
+    param_lower = parameter_name.lower()
     
-    for keyword in experimental_keywords:
-        if keyword in param_lower:
-            return "Experimental"
+    # Only keywords starting with a character present in the name can match
+    best_rank = None
+    best_section = "General"  # Default to General if no match
+    for char in set(param_lower):
+        for rank, keyword, section in _KW_BY_FIRST.get(char, ()):
+            if best_rank is not None and rank >= best_rank:
+                break
+            if keyword in param_lower:
+                best_rank = rank
+                best_section = section
+                break
     
-    # Check Software & Files first (highest priority for software-related terms)
-    for keyword in software_keywords:
-        if keyword in param_lower:
-            return "Software & Files"
-        
-    # Default to General if no match
-    return "General"
\ No newline at end of file
+    return best_section
@@ -5,7 +5,9 @@ This worker is much simpler and focuses only on GUI integration,
 delegating the actual work to specialized services.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import threading
+
+from PyQt6.QtCore import QThread, QTimer, QMetaObject, Qt, pyqtSignal
 from typing import Dict, Any, Optional
 
 from ..services import UploadManager, UploadStatus
@@ -16,8 +18,11 @@ class ModularUploadWorker(QThread):
     """
     Simplified upload worker using modular services
     
-    This worker acts as a bridge between the GUI and the upload service,
-    translating between Qt signals and service callbacks.
+    This worker acts as a bridge between the GUI and the upload service.
+    Instead of emitting a Qt signal for every service callback, it polls the
+    upload manager's progress state from a GUI-thread timer and only emits
+    when something changed, so the GUI is never refreshed more than ~60 times
+    per second regardless of upload chunk granularity.
     """
     
     # Qt signals
@@ -26,6 +31,9 @@ class ModularUploadWorker(QThread):
     upload_completed = pyqtSignal(dict)
     upload_failed = pyqtSignal(str)
     
+    # Polling interval for progress/status updates (~60 Hz)
+    POLL_INTERVAL_MS = 16
+    
     def __init__(self, upload_manager: UploadManager, 
                  metadata: Dict[str, Any],
                  file_path: str,
@@ -45,37 +53,56 @@ class ModularUploadWorker(QThread):
         self.file_path = file_path
         self.publish = publish
         self._cancelled = False
+        
+        # Last emitted (percentage, message); guarded because the final flush
+        # happens on the worker thread while the timer fires on the GUI thread
+        self._last_state = (None, None)
+        self._poll_lock = threading.Lock()
+        
+        # The timer lives in the GUI thread (like this QThread object itself)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._emit_state)
     
     def cancel(self):
         """Cancel the upload operation"""
         self._cancelled = True
+        self._poll_timer.stop()
         self.upload_manager.cancel_upload()
         self.quit()
     
     def run(self):
         """Execute the upload in a separate thread"""
+        # Start polling on the GUI thread
+        QMetaObject.invokeMethod(self._poll_timer, "start", Qt.ConnectionType.QueuedConnection)
         try:
-            # Create callbacks that emit Qt signals
-            def progress_callback(percentage: int) -> None:
-                if not self._cancelled:
-                    self.progress_updated.emit(percentage)
-            
-            def status_callback(message: str) -> None:
-                if not self._cancelled:
-                    self.status_updated.emit(message)
-            
-            # Perform upload using the service
+            # Perform upload using the service; progress is pulled by the timer
             result = self.upload_manager.upload(
                 metadata=self.metadata,
                 file_path=self.file_path,
-                publish=self.publish,
-                progress_callback=progress_callback,
-                status_callback=status_callback
+                publish=self.publish
             )
             
             if not self._cancelled:
+                self._emit_state()
                 self.upload_completed.emit(result)
-                
+        
         except Exception as e:
             if not self._cancelled:
-                self.upload_failed.emit(str(e))
\ No newline at end of file
+                self._emit_state()
+                self.upload_failed.emit(str(e))
+        finally:
+            QMetaObject.invokeMethod(self._poll_timer, "stop", Qt.ConnectionType.QueuedConnection)
+    
+    def _emit_state(self):
+        """Emit progress/status signals if the upload state changed since the last poll"""
+        if self._cancelled:
+            return
+        percentage, message = self.upload_manager.get_progress_state()
+        with self._poll_lock:
+            last_percentage, last_message = self._last_state
+            self._last_state = (percentage, message)
+        if percentage != last_percentage:
+            self.progress_updated.emit(percentage)
+        if message and message != last_message:
+            self.status_updated.emit(message)
\ No newline at end of file
@@ -17,20 +17,69 @@ from PyQt6.QtWidgets import (
     QListWidget, QListWidgetItem, QTabWidget, QCheckBox, QSpinBox,
     QDateEdit, QScrollArea, QFrame, QSplitter
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings, QDate
-from PyQt6.QtGui import QFont, QPixmap, QIcon, QCursor
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QSettings, QDate, QRegularExpression
+from PyQt6.QtGui import QFont, QPixmap, QIcon, QCursor, QRegularExpressionValidator
 from PyQt6.QtCore import QPropertyAnimation, QSize
 
 from ..services.metadata import Creator, EDParameters, ZenodoMetadata
 
+# Contributor types offered in the dropdown (common Zenodo types)
+_CONTRIBUTOR_TYPES = (
+    "ContactPerson",
+    "DataCollector",
+    "DataCurator",
+    "DataManager",
+    "Distributor",
+    "Editor",
+    "HostingInstitution",
+    "Producer",
+    "ProjectLeader",
+    "ProjectManager",
+    "ProjectMember",
+    "RegistrationAgency",
+    "RegistrationAuthority",
+    "RelatedPerson",
+    "Researcher",
+    "ResearchGroup",
+    "RightsHolder",
+    "Sponsor",
+    "Supervisor",
+    "WorkPackageLeader",
+    "Other"
+)
+_CONTRIBUTOR_TYPE_INDEX = {name: index for index, name in enumerate(_CONTRIBUTOR_TYPES)}
+_DEFAULT_CONTRIBUTOR_TYPE_INDEX = _CONTRIBUTOR_TYPE_INDEX["Researcher"]
+
+# ORCID format: 0000-0000-0000-0000 (where last digit can be X); the same
+# rule as MetadataValidator._is_valid_orcid, enforced while typing
+_ORCID_RE = QRegularExpression(r'\d{4}-\d{4}-\d{4}-\d{3}[\dX]')
+
 class QCollapsibleBox(QWidget):
     """A custom collapsible box widget"""
     
+    # Application-wide style for the toggle buttons; added to the
+    # QApplication style sheet by the first box, so Qt parses it a single
+    # time for all boxes
+    STYLESHEET = """
+        QPushButton#CollapsibleToggle {
+            text-align: left;
+            padding: 4px;
+            margin: 0px;
+            border: none;
+            background-color: #f0f0f0;
+            border-radius: 2px;
+        }
+        QPushButton#CollapsibleToggle:hover {
+            background-color: #e0e0e0;
+        }
+    """
+    
     def __init__(self, title="", parent=None, collapsed=False):
         super().__init__(parent)
+        self._install_stylesheet()
         
         self.toggleButton = QPushButton(title)
-        self.toggleButton.setStyleSheet("text-align: left; padding: 5px;")
+        self.toggleButton.setObjectName("CollapsibleToggle")
         self.toggleButton.setCheckable(True)
         self.toggleButton.setChecked(not collapsed)  # Inverted logic: checked means expanded
         self.toggleButton.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
@@ -46,25 +95,21 @@ class QCollapsibleBox(QWidget):
         
         self.toggleButton.toggled.connect(self.toggle)
         
+    @classmethod
+    def _install_stylesheet(cls):
+        """Add STYLESHEET to the running application, once per application"""
+        app = QApplication.instance()
+        if app is None or app.property("collapsibleBoxStyleInstalled"):
+            return
+        app.setStyleSheet(app.styleSheet() + cls.STYLESHEET)
+        app.setProperty("collapsibleBoxStyleInstalled", True)
+        
     def setContentLayout(self, layout):
         layout.setContentsMargins(8, 4, 8, 4)
         layout.setSpacing(4)
         self.contentWidget.setLayout(layout)
         
-        self.toggleButton.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 4px;
-                margin: 0px;
-                border: none;
-                background-color: #f0f0f0;
-                border-radius: 2px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        
+    @pyqtSlot(bool)
     def toggle(self, checked):
         self.contentWidget.setVisible(checked)
 
@@ -87,6 +132,7 @@ class CreatorWidget(QWidget):
         
         self.orcid_edit = QLineEdit()
         self.orcid_edit.setPlaceholderText("0000-0000-0000-0000")
+        self.orcid_edit.setValidator(QRegularExpressionValidator(_ORCID_RE, self.orcid_edit))
         
         # NOTE: Type field commented out - this is for future Contributors support
         # Zenodo creators API doesn't support type field, only contributors API does
@@ -108,11 +154,13 @@ class CreatorWidget(QWidget):
         """Get creator data as dictionary"""
         data = {"name": self.name_edit.text().strip()}
         
-        if self.affiliation_edit.text().strip():
-            data["affiliation"] = self.affiliation_edit.text().strip()
+        affiliation = self.affiliation_edit.text().strip()
+        if affiliation:
+            data["affiliation"] = affiliation
         
-        if self.orcid_edit.text().strip():
-            data["orcid"] = self.orcid_edit.text().strip()
+        orcid = self.orcid_edit.text().strip()
+        if orcid:
+            data["orcid"] = orcid
             
         # NOTE: Type field commented out for future Contributors support
         # if self.type_edit.text().strip():
@@ -153,33 +201,14 @@ class ContributorWidget(QWidget):
         
         self.orcid_edit = QLineEdit()
         self.orcid_edit.setPlaceholderText("0000-0000-0000-0000")
+        self.orcid_edit.setValidator(QRegularExpressionValidator(_ORCID_RE, self.orcid_edit))
         
         # Contributor type dropdown with common Zenodo types
         self.type_combo = QComboBox()
-        self.type_combo.addItems([
-            "ContactPerson",
-            "DataCollector", 
-            "DataCurator",
-            "DataManager",
-            "Distributor",
-            "Editor",
-            "HostingInstitution",
-            "Producer",
-            "ProjectLeader",
-            "ProjectManager",
-            "ProjectMember",
-            "RegistrationAgency",
-            "RegistrationAuthority",
-            "RelatedPerson",
-            "Researcher",
-            "ResearchGroup",
-            "RightsHolder",
-            "Sponsor",
-            "Supervisor",
-            "WorkPackageLeader",
-            "Other"
-        ])
-        self.type_combo.setCurrentText("Researcher")  # Default
+        self.type_combo.blockSignals(True)
+        self.type_combo.addItems(_CONTRIBUTOR_TYPES)
+        self.type_combo.setCurrentIndex(_DEFAULT_CONTRIBUTOR_TYPE_INDEX)
+        self.type_combo.blockSignals(False)
         
         layout.addWidget(QLabel("Name:"))
         layout.addWidget(self.name_edit)
@@ -196,14 +225,17 @@ class ContributorWidget(QWidget):
         """Get contributor data as dictionary"""
         data = {"name": self.name_edit.text().strip()}
         
-        if self.affiliation_edit.text().strip():
-            data["affiliation"] = self.affiliation_edit.text().strip()
+        affiliation = self.affiliation_edit.text().strip()
+        if affiliation:
+            data["affiliation"] = affiliation
         
-        if self.orcid_edit.text().strip():
-            data["orcid"] = self.orcid_edit.text().strip()
+        orcid = self.orcid_edit.text().strip()
+        if orcid:
+            data["orcid"] = orcid
             
-        if self.type_combo.currentText():
-            data["type"] = self.type_combo.currentText()
+        contributor_type = self.type_combo.currentText()
+        if contributor_type:
+            data["type"] = contributor_type
         
         return data
     
@@ -215,7 +247,10 @@ class ContributorWidget(QWidget):
         
         # Set type in combo box
         contributor_type = data.get("type", "Researcher")
-        index = self.type_combo.findText(contributor_type)
+        index = _CONTRIBUTOR_TYPE_INDEX.get(contributor_type)
+        if index is None:
+            # Custom types added by earlier set_data calls
+            index = self.type_combo.findText(contributor_type)
         if index >= 0:
             self.type_combo.setCurrentIndex(index)
         else:
@@ -228,5 +263,5 @@ class ContributorWidget(QWidget):
         self.name_edit.clear()
         self.affiliation_edit.clear()
         self.orcid_edit.clear()
-        self.type_combo.setCurrentText("Researcher")
+        self.type_combo.setCurrentIndex(_DEFAULT_CONTRIBUTOR_TYPE_INDEX)
 
@@ -0,0 +1,52 @@
+"""
+Worker thread for packing a folder into a ZIP file
+
+Archiving a large folder can take minutes, so it runs off the GUI thread.
+"""
+
+import threading
+from typing import Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ..services.file_packing import create_zip_from_folder
+
+
+class ZipWorker(QThread):
+    """Creates a ZIP file from a folder in a separate thread"""
+    
+    # Qt signals
+    zip_completed = pyqtSignal(str)
+    zip_failed = pyqtSignal(str)
+    
+    def __init__(self, folder_path: str, zip_path: str):
+        """
+        Initialize zip worker
+        
+        Args:
+            folder_path: Folder to archive
+            zip_path: Path of the ZIP file to create
+        """
+        super().__init__()
+        self.folder_path = folder_path
+        self.zip_path = zip_path
+        # Path of the finished ZIP file; None until it was written completely
+        self.created_path: Optional[str] = None
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Stop creating the ZIP file (before the next file is added)"""
+        self._cancel_event.set()
+    
+    def run(self):
+        """Create the ZIP file"""
+        try:
+            self.created_path = create_zip_from_folder(
+                self.folder_path, self.zip_path,
+                cancel_checker=self._cancel_event.is_set
+            )
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                self.zip_failed.emit(str(e))
+            return
+        self.zip_completed.emit(self.created_path)
\ No newline at end of file
@@ -3,43 +3,107 @@ Services package initialization
 
 Provides high-level services for the Zenodo uploader application.
 Each service handles a specific concern and can be used independently.
+
+Submodules are imported lazily (PEP 562): a name exported here is only
+imported from its submodule on first access, so startup only pays for the
+services that are actually used.
 """
 
-# Core data structures and file handling
-from .metadata import Creator, Contributor, EDParameters, ZenodoMetadata, Funding
-from .file_packing import create_zip_from_folder, compute_checksums
-from .templates import MetadataTemplate, TemplateService, TemplateCreator, TemplateContributor, TemplateFunding, TemplateCommunity, TemplateEDParameters
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    # Core data structures and file handling
+    'Creator': 'metadata',
+    'Contributor': 'metadata',
+    'EDParameters': 'metadata',
+    'ZenodoMetadata': 'metadata',
+    'Funding': 'metadata',
+    'create_zip_from_folder': 'file_packing',
+    'compute_checksums': 'file_packing',
+    'MetadataTemplate': 'templates',
+    'TemplateService': 'templates',
+    'TemplateCreator': 'templates',
+    'TemplateContributor': 'templates',
+    'TemplateFunding': 'templates',
+    'TemplateCommunity': 'templates',
+    'TemplateEDParameters': 'templates',
+    
+    # CIF file parsing
+    'CIFParser': 'cif_parser',
+    'CIFData': 'cif_parser',
+    'extract_parameters_from_cif': 'cif_parser',
+    'parse_multiple_cifs': 'cif_parser',
+    'CIF_TO_PARAMETER_MAPPING': 'cif_parser',
+    
+    # User configuration and settings location
+    'get_user_config_directory': 'user_config',
+    'ensure_user_config_directory': 'user_config',
+    'get_settings_file_path': 'user_config',
+    'get_user_template_path': 'user_config',
+    'get_user_cif_mappings_path': 'user_config',
+    'get_tokens_file_path': 'user_config',
+    'get_uploads_cache_path': 'user_config',
+    'get_uploads_resume_path': 'user_config',
+    'load_tokens': 'user_config',
+    'save_tokens': 'user_config',
+    'load_settings': 'user_config',
+    'save_settings': 'user_config',
+    'load_json_config': 'user_config',
+    'save_json_config': 'user_config',
+    'encode_json': 'user_config',
+    'get_bundled_resource_path': 'user_config',
+    'open_user_config_directory': 'user_config',
+    
+    # Legacy QSettings-based settings (kept for interface compliance)
+    'QtSettingsManager': 'settings',
+    'DefaultMetadataProvider': 'settings',
+    
+    # File and metadata validation
+    'ZenodoFileValidator': 'validation',
+    'BatchFileValidator': 'validation',
+    'ZenodoMetadataValidator': 'metadata_validation',
+    
+    # Upload management
+    'UploadManager': 'upload',
+    'BatchUploadManager': 'upload',
+    'UploadStatus': 'upload',
+    'UploadCache': 'upload',
+    'ResumeLedger': 'upload',
+    
+    # Service factory for dependency injection
+    'ServiceFactory': 'factory',
+    'get_service_factory': 'factory',
+    'initialize_services': 'factory',
+}
 
-# CIF file parsing
-from .cif_parser import CIFParser, CIFData, extract_parameters_from_cif, parse_multiple_cifs, CIF_TO_PARAMETER_MAPPING
 
-# User configuration and settings location
-from .user_config import (
-    get_user_config_directory, ensure_user_config_directory, 
-    get_settings_file_path, get_user_template_path, get_user_cif_mappings_path,
-    get_tokens_file_path, load_tokens, save_tokens,
-    load_settings, save_settings, load_json_config, save_json_config,
-    get_bundled_resource_path, open_user_config_directory
-)
+def __getattr__(name):
+    """Import an exported name from its submodule on first access"""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
-# File and metadata validation
-from .validation import ZenodoFileValidator, BatchFileValidator
-from .metadata_validation import ZenodoMetadataValidator
 
-# Upload management
-from .upload import UploadManager, BatchUploadManager, UploadStatus
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# Service factory for dependency injection
-from .factory import ServiceFactory, get_service_factory, initialize_services
 
 # Make key classes available at package level
 __all__ = [
     'ZenodoFileValidator',
-    'BatchFileValidator', 
+    'BatchFileValidator',
     'ZenodoMetadataValidator',
     'UploadManager',
     'BatchUploadManager',
     'UploadStatus',
+    'UploadCache',
+    'ResumeLedger',
     'ServiceFactory',
     'get_service_factory',
     'initialize_services',
@@ -57,6 +121,9 @@ __all__ = [
     'save_settings',
     'load_json_config',
     'save_json_config',
+    'encode_json',
     'get_bundled_resource_path',
-    'open_user_config_directory'
+    'open_user_config_directory',
+    'QtSettingsManager',
+    'DefaultMetadataProvider'
 ]
\ No newline at end of file
@@ -8,13 +8,35 @@ The CIF data name mappings are loaded from templates/cif_mappings.json for
 easy customization without modifying Python code.
 """
 
+import io
+import os
 import re
+import sys
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
+try:
+    # Optional faster JSON parser; falls back to the standard library
+    import orjson
+except ImportError:
+    orjson = None
+
+# Performance note: the parsing hot path is regex matching, string handling
+# and dict population, not numeric loops, so Numba does not apply (object
+# mode would only add dispatch overhead). The place for a compiled speedup is
+# a Cython/PyO3 build of parse_string. If such an extension is installed as
+# _zedd_cif_native, CIFParser.parse_string and CIFParser.parse_file delegate
+# to it. It must return a CIFData with the same shape as the pure Python parser.
+try:
+    from _zedd_cif_native import parse_string as _parse_string_native
+except ImportError:
+    _parse_string_native = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,8 +44,9 @@ logger = logging.getLogger(__name__)
 # CIF MAPPING CONFIGURATION LOADER
 # =========================================================================
 
+@lru_cache(maxsize=1)
 def _get_templates_dir() -> Path:
-    """Get the templates directory path"""
+    """Get the templates directory path (resolved once per process)"""
     # Try relative to this file first
     this_file = Path(__file__).resolve()
     templates_dir = this_file.parent.parent.parent / "templates"
@@ -55,8 +78,11 @@ def _load_cif_mappings() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
             logger.warning(f"CIF mappings file not found: {config_file}")
             return {}, {}
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        if orjson is not None:
+            config = orjson.loads(config_file.read_bytes())
+        else:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
         
         # Flatten parameter_mapping from categorized structure
         parameter_mapping = {}
@@ -89,6 +115,9 @@ def _load_cif_mappings() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
 # Load mappings at module import time
 CIF_TO_PARAMETER_MAPPING, CIF_TAG_ALIASES = _load_cif_mappings()
 
+# CIF values meaning unknown ('?') or not applicable ('.')
+_CIF_NULL_SET = frozenset(('?', '.'))
+
 
 @dataclass
 class CIFData:
@@ -96,7 +125,8 @@ class CIFData:
     filename: str
     data_block_name: str = ""
     data_items: Dict[str, str] = field(default_factory=dict)
-    loop_data: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+    # Loops are stored column-wise: {category: {'tags': [...], 'columns': {tag: [values]}}}
+    loop_data: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     def get(self, key: str, default: str = "") -> str:
         """Get a data item value, checking common prefixes"""
@@ -111,8 +141,47 @@ class CIFData:
         return default
     
     def get_loop_items(self, category: str) -> List[Dict[str, str]]:
-        """Get all items from a loop category (e.g., 'audit_author')"""
-        return self.loop_data.get(category, [])
+        """Get all items from a loop category (e.g., 'audit_author') as row dicts"""
+        loop = self.loop_data.get(category)
+        if not loop:
+            return []
+        tags = loop['tags']
+        columns = loop['columns']
+        # None marks a tag that was absent from the loop a row came from
+        return [
+            {tag: value for tag, value in zip(tags, row) if value is not None}
+            for row in zip(*(columns[tag] for tag in tags))
+        ]
+    
+    def get_loop_column(self, category: str, tag: str) -> List[Optional[str]]:
+        """Get all values of one tag in a loop category without building rows"""
+        loop = self.loop_data.get(category)
+        if not loop:
+            return []
+        return loop['columns'].get(tag, [])
+
+
+class _LineReader:
+    """Line iterator with one line of pushback for lookahead"""
+    
+    __slots__ = ('_lines', '_pushed')
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines: Iterator[str] = iter(lines)
+        self._pushed: Optional[str] = None
+    
+    def __iter__(self) -> '_LineReader':
+        return self
+    
+    def __next__(self) -> str:
+        if self._pushed is not None:
+            line, self._pushed = self._pushed, None
+            return line
+        return next(self._lines)
+    
+    def push_back(self, line: str) -> None:
+        """Return a line so that it is yielded again by the next iteration"""
+        self._pushed = line
 
 
 class CIFParser:
@@ -125,17 +194,27 @@ class CIFParser:
     - Loop structures
     """
     
-    def __init__(self):
-        # Regex patterns
-        self._data_block_pattern = re.compile(r'^data_(\S+)', re.IGNORECASE)
-        self._tag_pattern = re.compile(r'^(_\S+)\s+(.+)$')
-        self._loop_pattern = re.compile(r'^loop_\s*$', re.IGNORECASE)
-        self._tag_only_pattern = re.compile(r'^(_\S+)\s*$')
+    # Loop value tokens: double-quoted, single-quoted (an unterminated quote
+    # runs to the end of the line) or a bare run of non-blank characters
+    _LOOP_TOKEN_RE = re.compile(r'"([^"]*)(?:"|$)|\'([^\']*)(?:\'|$)|([^ \t]+)')
+    
+    # Single line classifier: data block header, loop start,
+    # tag with value on the same line, or tag with value on following lines
+    _LINE_RE = re.compile(
+        r'^(?:data_(?P<block>\S+)'
+        r'|(?P<loop>loop_)\s*$'
+        r'|(?P<tag>_\S+)\s+(?P<value>.+)$'
+        r'|(?P<tag_only>_\S+)\s*$)',
+        re.IGNORECASE
+    )
     
     def parse_file(self, filepath: str) -> CIFData:
         """
         Parse a CIF file and return structured data.
         
+        The file is streamed line by line rather than read into memory,
+        unless the native parser is installed (it takes the whole content).
+        
         Args:
             filepath: Path to the CIF file
             
@@ -146,19 +225,19 @@ class CIFParser:
         if not path.exists():
             raise FileNotFoundError(f"CIF file not found: {path}")
         
-        # Try different encodings
-        content = None
+        # Try different encodings (a decode error may only surface mid-file,
+        # in which case parsing restarts with the next encoding)
         for encoding in ['utf-8', 'latin-1', 'cp1252']:
             try:
-                content = path.read_text(encoding=encoding)
-                break
+                # newline=None performs universal newline translation while reading
+                with open(path, 'r', encoding=encoding, newline=None) as f:
+                    if _parse_string_native is not None:
+                        return _parse_string_native(f.read(), path.name)
+                    return self.parse_lines(f, path.name)
             except UnicodeDecodeError:
                 continue
         
-        if content is None:
-            raise ValueError(f"Could not decode CIF file: {path}")
-        
-        return self.parse_string(content, path.name)
+        raise ValueError(f"Could not decode CIF file: {path}")
     
     def parse_string(self, content: str, filename: str = "unknown") -> CIFData:
         """
@@ -168,198 +247,204 @@ class CIFParser:
             content: CIF file content as string
             filename: Name to associate with the data
             
+        Returns:
+            CIFData object containing parsed data
+        """
+        if _parse_string_native is not None:
+            return _parse_string_native(content, filename)
+        
+        # Normalize line endings while splitting
+        return self.parse_lines(io.StringIO(content, newline=None), filename)
+    
+    def parse_lines(self, lines: Iterable[str], filename: str = "unknown") -> CIFData:
+        """
+        Parse CIF content from an iterable of lines.
+        
+        Args:
+            lines: Lines of CIF content, with or without trailing newlines
+                (e.g. an open text file)
+            filename: Name to associate with the data
+            
         Returns:
             CIFData object containing parsed data
         """
         cif_data = CIFData(filename=filename)
+        reader = _LineReader(lines)
         
-        # Normalize line endings
-        lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        # Bind the matcher locally to avoid attribute lookups per line
+        match_line = self._LINE_RE.match
+        # Tags are interned so repeated names share one string object
+        intern = sys.intern
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        for raw in reader:
+            # Skip empty lines and comments before allocating a stripped copy
+            if not raw or raw[0] == '#' or raw.isspace():
+                continue
             
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                i += 1
+            line = raw.strip()
+            if line[0] == '#':  # Indented comment
                 continue
             
+            match = match_line(line)
+            kind = match.lastgroup if match else None
+            
             # Check for data block
-            match = self._data_block_pattern.match(line)
-            if match:
-                cif_data.data_block_name = match.group(1)
-                i += 1
+            if kind == 'block':
+                cif_data.data_block_name = match.group('block')
                 continue
             
             # Check for loop
-            if self._loop_pattern.match(line):
-                i = self._parse_loop(lines, i, cif_data)
+            if kind == 'loop':
+                self._parse_loop(reader, cif_data)
                 continue
             
             # Check for tag-value pair on same line
-            match = self._tag_pattern.match(line)
-            if match:
-                tag = match.group(1).lower()
-                value = self._clean_value(match.group(2))
+            if kind == 'value':
+                tag = intern(match.group('tag').lower())
+                value = self._clean_value(match.group('value'))
                 cif_data.data_items[tag] = value
-                i += 1
                 continue
             
             # Check for tag only (value on next line or multiline)
-            match = self._tag_only_pattern.match(line)
-            if match:
-                tag = match.group(1).lower()
-                i += 1
-                if i < len(lines):
-                    next_line = lines[i].strip()
-                    if next_line.startswith(';'):
-                        # Multi-line value
-                        value, i = self._parse_multiline(lines, i)
-                        cif_data.data_items[tag] = value
-                    else:
-                        # Single value on next line
-                        cif_data.data_items[tag] = self._clean_value(next_line)
-                        i += 1
+            if kind == 'tag_only':
+                tag = intern(match.group('tag_only').lower())
+                next_raw = next(reader, None)
+                if next_raw is None:
+                    # End of input: a newline-terminated tag line still gets
+                    # an (empty) value, as the line after it is blank
+                    if raw.endswith('\n'):
+                        cif_data.data_items[tag] = ''
+                    continue
+                next_line = next_raw.strip()
+                if next_line.startswith(';'):
+                    # Multi-line value
+                    cif_data.data_items[tag] = self._parse_multiline(reader)
+                else:
+                    # Single value on next line
+                    cif_data.data_items[tag] = self._clean_value(next_line)
                 continue
             
-            # Check for multiline value starting
-            if line.startswith(';'):
-                # This shouldn't happen without a preceding tag, skip
-                i += 1
-                continue
-            
-            i += 1
+            # Anything else (including a multiline value without a preceding
+            # tag, which shouldn't happen) is skipped
         
         return cif_data
     
-    def _parse_multiline(self, lines: List[str], start_idx: int) -> Tuple[str, int]:
-        """Parse a semicolon-delimited multiline value"""
-        # Skip the opening semicolon line
-        i = start_idx + 1
+    def _parse_multiline(self, reader: '_LineReader') -> str:
+        """Parse a semicolon-delimited multiline value (opening line already consumed)"""
         value_lines = []
         
-        while i < len(lines):
-            line = lines[i]
+        for line in reader:
             if line.strip().startswith(';') and len(line.strip()) == 1:
                 # End of multiline
-                i += 1
                 break
-            value_lines.append(line)
-            i += 1
+            # Drop the terminator, if any, so lines with and without one join alike
+            value_lines.append(line.rstrip('\r\n'))
         
-        return '\n'.join(value_lines).strip(), i
+        return '\n'.join(value_lines).strip()
     
-    def _parse_loop(self, lines: List[str], start_idx: int, cif_data: CIFData) -> int:
-        """Parse a loop_ structure"""
-        i = start_idx + 1  # Skip 'loop_' line
+    def _parse_loop(self, reader: '_LineReader', cif_data: CIFData) -> None:
+        """Parse a loop_ structure (the 'loop_' line already consumed)"""
         tags = []
         
         # Collect tags
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith('#'):
-                i += 1
+        for raw in reader:
+            if not raw or raw[0] == '#' or raw.isspace():
+                continue
+            line = raw.strip()
+            if line[0] == '#':
                 continue
             if line.startswith('_'):
-                tags.append(line.lower())
-                i += 1
+                tags.append(sys.intern(line.lower()))
             else:
+                reader.push_back(raw)
                 break
         
         if not tags:
-            return i
+            return
         
         # Determine category from first tag
         category = tags[0].split('.')[0].lstrip('_') if '.' in tags[0] else tags[0].lstrip('_').rsplit('_', 1)[0]
         
-        if category not in cif_data.loop_data:
-            cif_data.loop_data[category] = []
+        loop = cif_data.loop_data.get(category)
+        if loop is None:
+            loop = cif_data.loop_data[category] = {'tags': [], 'columns': {}}
+        columns = loop['columns']
+        
+        # A category may be looped more than once; new tags get a column
+        # padded for the rows already stored
+        row_count = len(columns[loop['tags'][0]]) if loop['tags'] else 0
+        for tag in tags:
+            if tag not in columns:
+                loop['tags'].append(tag)
+                columns[tag] = [None] * row_count
+        
+        # Column index per tag (a repeated tag keeps its last value)
+        width = len(tags)
+        targets = [(columns[tag], index) for tag, index in {tag: i for i, tag in enumerate(tags)}.items()]
         
         # Collect values
         values_buffer = []
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Stop at new data block, loop, or tag definition
-            if not line:
-                i += 1
+        for raw in reader:
+            # Skip empty lines and comments
+            if not raw or raw[0] == '#' or raw.isspace():
                 continue
-            if line.startswith('#'):
-                i += 1
+            line = raw.strip()
+            if line[0] == '#':
                 continue
+            
+            # Stop at new data block, loop, or tag definition
             if line.startswith('data_') or line.lower() == 'loop_' or (line.startswith('_') and not values_buffer):
+                reader.push_back(raw)
                 break
             
             # Handle multiline values in loops
             if line.startswith(';'):
-                value, i = self._parse_multiline(lines, i - 1)
-                values_buffer.append(value)
+                reader.push_back(raw)
+                values_buffer.append(self._parse_multiline(reader))
                 continue
             
             # Parse values from line
             parsed = self._parse_loop_values(line)
             values_buffer.extend(parsed)
-            i += 1
             
             # Check if we have complete rows
-            while len(values_buffer) >= len(tags):
-                row_values = values_buffer[:len(tags)]
-                values_buffer = values_buffer[len(tags):]
+            while len(values_buffer) >= width:
+                row_values = values_buffer[:width]
+                values_buffer = values_buffer[width:]
                 
-                row_dict = {}
-                for tag, value in zip(tags, row_values):
-                    row_dict[tag] = value
-                cif_data.loop_data[category].append(row_dict)
-        
-        return i
+                for column, index in targets:
+                    column.append(row_values[index])
+        
+        # Pad columns of tags missing from this loop
+        row_count = max(len(column) for column in columns.values())
+        for column in columns.values():
+            if len(column) < row_count:
+                column.extend([None] * (row_count - len(column)))
     
     def _parse_loop_values(self, line: str) -> List[str]:
         """Parse values from a loop data line, handling quoted strings"""
-        values = []
-        i = 0
-        line = line.strip()
-        
-        while i < len(line):
-            # Skip whitespace
-            while i < len(line) and line[i] in ' \t':
-                i += 1
-            
-            if i >= len(line):
-                break
-            
-            # Check for quoted string
-            if line[i] in '"\'':
-                quote = line[i]
-                i += 1
-                start = i
-                while i < len(line) and line[i] != quote:
-                    i += 1
-                values.append(line[start:i])
-                i += 1  # Skip closing quote
-            else:
-                # Unquoted value
-                start = i
-                while i < len(line) and line[i] not in ' \t':
-                    i += 1
-                values.append(self._clean_value(line[start:i]))
-        
-        return values
+        # Quoted values are taken verbatim, unquoted ones are cleaned
+        clean = self._clean_value
+        return [
+            clean(unquoted) if unquoted else double or single
+            for double, single, unquoted in self._LOOP_TOKEN_RE.findall(line.strip())
+        ]
     
     def _clean_value(self, value: str) -> str:
         """Clean a CIF value (remove quotes, handle special values)"""
         value = value.strip()
         
-        # Remove surrounding quotes
-        if len(value) >= 2:
-            if (value.startswith('"') and value.endswith('"')) or \
-               (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
-        
-        # Handle CIF special values
-        if value in ('?', '.'):
+        # CIF special values (unknown / not applicable)
+        if not value or value in _CIF_NULL_SET:
             return ''
         
+        # Remove surrounding quotes; a quoted special value is still special
+        quote = value[0]
+        if (quote == '"' or quote == "'") and len(value) >= 2 and value[-1] == quote:
+            value = value[1:-1]
+            if value in _CIF_NULL_SET:
+                return ''
+        
         return value
 
 
@@ -375,24 +460,18 @@ def extract_parameters_from_cif(cif_data: CIFData) -> Dict[str, Tuple[str, str]]
     """
     parameters = {}
     
-    # Process each data item
+    mapping = CIF_TO_PARAMETER_MAPPING
+    aliases = CIF_TAG_ALIASES
+    
+    # Process each data item; the normalized (alias-resolved) tag wins over
+    # the raw tag, and the first value found for a parameter is kept
     for cif_tag, value in cif_data.data_items.items():
         if not value:
             continue
         
-        # Normalize tag (handle aliases)
-        normalized_tag = CIF_TAG_ALIASES.get(cif_tag, cif_tag)
-        
-        # Check if we have a mapping for this tag
-        if normalized_tag in CIF_TO_PARAMETER_MAPPING:
-            param_name, section = CIF_TO_PARAMETER_MAPPING[normalized_tag]
-            # Don't overwrite if we already have a value (first match wins)
-            if param_name not in parameters:
-                parameters[param_name] = (value, section)
-        elif cif_tag in CIF_TO_PARAMETER_MAPPING:
-            param_name, section = CIF_TO_PARAMETER_MAPPING[cif_tag]
-            if param_name not in parameters:
-                parameters[param_name] = (value, section)
+        entry = mapping.get(aliases.get(cif_tag, cif_tag)) or mapping.get(cif_tag)
+        if entry and entry[0] not in parameters:
+            parameters[entry[0]] = (value, entry[1])
     
     # Handle special composite parameters
     _add_crystal_size(cif_data, parameters)
@@ -437,53 +516,54 @@ def _add_unit_cell(cif_data: CIFData, parameters: Dict[str, Tuple[str, str]]) ->
 
 def _add_authors(cif_data: CIFData, parameters: Dict[str, Tuple[str, str]]) -> None:
     """Extract author information from loop data"""
-    author_items = cif_data.get_loop_items("audit_author")
-    if author_items:
-        authors = []
-        for item in author_items:
-            name = item.get("_audit_author.name", "")
-            if name:
-                authors.append(name)
-        if authors:
-            parameters["CIF Author(s)"] = ("; ".join(authors), "General")
+    authors = [name for name in cif_data.get_loop_column("audit_author", "_audit_author.name") if name]
+    if authors:
+        parameters["CIF Author(s)"] = ("; ".join(authors), "General")
+
+
+def _parse_one(filepath: str) -> Tuple[str, Dict[str, Tuple[str, str]]]:
+    """Parse a single CIF file into (filename, parameters); runs in worker processes"""
+    try:
+        cif_data = CIFParser().parse_file(filepath)
+        return cif_data.filename, extract_parameters_from_cif(cif_data)
+    except Exception as e:
+        # Return partial results with error indication
+        return Path(filepath).name, {"Error": (str(e), "General")}
 
 
 def parse_multiple_cifs(filepaths: List[str]) -> List[Tuple[str, Dict[str, Tuple[str, str]]]]:
     """
     Parse multiple CIF files and extract parameters from each.
     
+    Files are independent, so batches are parsed in a process pool (the
+    parser is pure Python and would not scale across threads). A single
+    file is parsed in-process to avoid the worker startup cost.
+    
     Args:
         filepaths: List of paths to CIF files
         
     Returns:
-        List of (filename, parameters_dict) tuples
+        List of (filename, parameters_dict) tuples, in input order
     """
-    parser = CIFParser()
-    results = []
-    
-    for filepath in filepaths:
-        try:
-            cif_data = parser.parse_file(filepath)
-            parameters = extract_parameters_from_cif(cif_data)
-            results.append((cif_data.filename, parameters))
-        except Exception as e:
-            # Return partial results with error indication
-            results.append((Path(filepath).name, {"Error": (str(e), "General")}))
+    if len(filepaths) <= 1:
+        return [_parse_one(filepath) for filepath in filepaths]
     
-    return results
+    max_workers = min(os.cpu_count() or 1, len(filepaths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_one, filepaths))
 
 
-def get_all_cif_parameters() -> List[Tuple[str, str]]:
-    """
-    Get a list of all possible parameters that can be extracted from CIF files.
-    
-    Returns:
-        List of (parameter_name, section) tuples, sorted by section then name
-    """
+# Section display order for get_all_cif_parameters (unknown sections sort last)
+_SECTION_RANK = {section: rank for rank, section in enumerate(
+    ("General", "Instrumental", "Sample description", "Experimental", "Software & Files")
+)}
+
+
+@lru_cache(maxsize=1)
+def _sorted_cif_parameters() -> Tuple[Tuple[str, str], ...]:
+    """Build the sorted parameter list once; the mappings are fixed after import"""
     # Get unique parameter names and their sections
-    params = set()
-    for cif_tag, (param_name, section) in CIF_TO_PARAMETER_MAPPING.items():
-        params.add((param_name, section))
+    params = set(CIF_TO_PARAMETER_MAPPING.values())
     
     # Add composite parameters
     params.add(("Crystal size [mm]", "Sample description"))
@@ -491,14 +571,16 @@ def get_all_cif_parameters() -> List[Tuple[str, str]]:
     params.add(("CIF Author(s)", "General"))
     
     # Sort by section, then by name
-    section_order = ["General", "Instrumental", "Sample description", "Experimental", "Software & Files"]
-    
-    def sort_key(item):
-        name, section = item
-        try:
-            section_idx = section_order.index(section)
-        except ValueError:
-            section_idx = len(section_order)
-        return (section_idx, name.lower())
+    rank = _SECTION_RANK.get
+    unknown = len(_SECTION_RANK)
+    return tuple(sorted(params, key=lambda item: (rank(item[1], unknown), item[0].lower())))
+
+
+def get_all_cif_parameters() -> List[Tuple[str, str]]:
+    """
+    Get a list of all possible parameters that can be extracted from CIF files.
     
-    return sorted(list(params), key=sort_key)
+    Returns:
+        List of (parameter_name, section) tuples, sorted by section then name
+    """
+    return list(_sorted_cif_parameters())
\ No newline at end of file
@@ -14,7 +14,8 @@ from ..core.interfaces import (
 from ..api import ZenodoRepositoryAPI
 from ..services import (
     ZenodoFileValidator, ZenodoMetadataValidator,
-    UploadManager, TemplateService
+    UploadManager, UploadCache, ResumeLedger, BatchUploadManager,
+    TemplateService, load_settings
 )
 
 
@@ -24,11 +25,33 @@ class ServiceFactory:
     
     This implements a simple dependency injection pattern to manage
     service creation and dependencies.
+    
+    Optional upload features are enabled in the "uploads" section of
+    settings.json:
+    
+        "reuse_identical": return the existing deposition when the same
+            files and metadata are uploaded again (UploadCache)
+        "resume_interrupted": continue the draft deposition of a failed
+            upload when it is repeated, skipping the files that already
+            arrived (ResumeLedger; whole files only, not partial ones)
     """
     
+    __slots__ = (
+        '_file_validator', '_metadata_validator', '_template_service',
+        '_repository_api', '_upload_service', '_batch_upload_service',
+        '_initialized'
+    )
+    
     def __init__(self):
         """Initialize the service factory"""
-        self._services = {}
+        self._file_validator = None
+        self._metadata_validator = None
+        self._template_service = None
+        # API-dependent services stay None until a token is configured
+        self._repository_api = None
+        self._upload_service = None
+        # Created on first use, for the current upload service
+        self._batch_upload_service = None
         self._initialized = False
     
     def create_services(self, api_token: str = "", sandbox: bool = True) -> None:
@@ -40,23 +63,20 @@ class ServiceFactory:
             sandbox: Whether to use sandbox mode
         """
         # Core services
-        self._services['file_validator'] = ZenodoFileValidator()
-        self._services['metadata_validator'] = ZenodoMetadataValidator()
-        self._services['template_service'] = TemplateService()
+        self._file_validator = ZenodoFileValidator()
+        self._metadata_validator = ZenodoMetadataValidator()
+        self._template_service = TemplateService()
         
         # API service (conditionally created based on token)
         if api_token:
-            self._services['repository_api'] = ZenodoRepositoryAPI(
+            self._repository_api = ZenodoRepositoryAPI(
                 access_token=api_token,
                 sandbox=sandbox
             )
             
             # Upload service (depends on API and validators)
-            self._services['upload_service'] = UploadManager(
-                repository_api=self._services['repository_api'],
-                file_validator=self._services['file_validator'],
-                metadata_validator=self._services['metadata_validator']
-            )
+            self._upload_service = self._create_upload_service()
+            self._release_batch_upload_service()
         
         self._initialized = True
     
@@ -72,51 +92,82 @@ class ServiceFactory:
         self._ensure_initialized()
 
         if api_token:
-            self._services['repository_api'] = ZenodoRepositoryAPI(
+            self._repository_api = ZenodoRepositoryAPI(
                 access_token=api_token,
                 sandbox=sandbox
             )
             
             # Recreate upload service with new API
-            self._services['upload_service'] = UploadManager(
-                repository_api=self._services['repository_api'],
-                file_validator=self._services['file_validator'],
-                metadata_validator=self._services['metadata_validator']
-            )
+            self._upload_service = self._create_upload_service()
         else:
             # Remove API-dependent services if no token
-            self._services.pop('repository_api', None)
-            self._services.pop('upload_service', None)
+            self._repository_api = None
+            self._upload_service = None
+        self._release_batch_upload_service()
+    
+    def _create_upload_service(self) -> UploadManager:
+        """Create the upload manager, with the upload options from settings.json"""
+        upload_settings = load_settings().get('uploads', {})
+        return UploadManager(
+            repository_api=self._repository_api,
+            file_validator=self._file_validator,
+            metadata_validator=self._metadata_validator,
+            upload_cache=UploadCache() if upload_settings.get('reuse_identical') else None,
+            resume_ledger=ResumeLedger() if upload_settings.get('resume_interrupted') else None
+        )
     
     def get_file_validator(self) -> FileValidator:
         """Get the file validator service"""
         self._ensure_initialized()
-        return self._services['file_validator']
+        return self._file_validator
     
     def get_metadata_validator(self) -> MetadataValidator:
         """Get the metadata validator service"""
         self._ensure_initialized()
-        return self._services['metadata_validator']
+        return self._metadata_validator
     
     def get_template_service(self) -> 'TemplateService':
         """Get the template service"""
         self._ensure_initialized()
-        return self._services['template_service']
+        return self._template_service
     
     def get_repository_api(self) -> Optional[RepositoryAPI]:
         """Get the repository API service (may be None if no token)"""
         self._ensure_initialized()
-        return self._services.get('repository_api')
+        return self._repository_api
     
     def get_upload_service(self) -> Optional[UploadService]:
         """Get the upload service (may be None if no API)"""
         self._ensure_initialized()
-        return self._services.get('upload_service')
+        return self._upload_service
+    
+    def get_batch_upload_service(self) -> Optional[BatchUploadManager]:
+        """Get the batch upload service (may be None if no API)"""
+        self._ensure_initialized()
+        if self._batch_upload_service is None and self._upload_service is not None:
+            self._batch_upload_service = BatchUploadManager(self._upload_service)
+        return self._batch_upload_service
     
     def has_api_services(self) -> bool:
         """Check if API-dependent services are available"""
         self._ensure_initialized()
-        return 'repository_api' in self._services
+        return self._repository_api is not None
+    
+    def shutdown(self) -> None:
+        """Cancel running uploads and release their worker threads (call on exit)"""
+        if self._batch_upload_service is not None:
+            self._batch_upload_service.cancel()
+            self._batch_upload_service.shutdown(wait=False)
+        if self._upload_service is not None:
+            self._upload_service.cancel_upload()
+            self._upload_service.close(wait=False)
+    
+    def _release_batch_upload_service(self) -> None:
+        """Drop the batch upload service of a replaced upload service"""
+        if self._batch_upload_service is not None:
+            # A running batch still finishes; its threads exit afterwards
+            self._batch_upload_service.shutdown(wait=False)
+            self._batch_upload_service = None
     
     def _ensure_initialized(self) -> None:
         """Ensure services are initialized"""
@@ -124,8 +175,10 @@ class ServiceFactory:
             self.create_services()
 
 
-# Global service factory instance
-_service_factory: Optional[ServiceFactory] = None
+# Global service factory instance. Construction only sets empty slots, so it
+# is created eagerly at import (thread-safe, no per-call None check); services
+# themselves are still created lazily by create_services().
+_service_factory = ServiceFactory()
 
 def get_service_factory() -> ServiceFactory:
     """
@@ -134,9 +187,6 @@ def get_service_factory() -> ServiceFactory:
     Returns:
         ServiceFactory instance
     """
-    global _service_factory
-    if _service_factory is None:
-        _service_factory = ServiceFactory()
     return _service_factory
 
 
@@ -5,7 +5,6 @@ Metadata handling for Zenodo uploads
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from .metadata_validation import validate_funder_api, validate_community_api
 
 # Comprehensive list of major funders with DOI prefixes
 # Combines key research funders with extensive list from Zenodo API
@@ -45,13 +44,36 @@ COMPREHENSIVE_FUNDERS = {
     "Wellcome Trust": "10.13039/100004440",
 }
 
-@dataclass
+# Funder names in display order (for autocomplete) and as a set for lookups
+_FUNDER_NAMES = tuple(COMPREHENSIVE_FUNDERS)
+_FUNDER_NAME_SET = frozenset(_FUNDER_NAMES)
+
+# Fixed parts of the HTML parameter table (see EDParameters._generate_html_table)
+_HTML_PREFIX = '\n'.join([
+    '<p>The table below summarizes the data collection parameters:</p>',
+    '<table border="1" style="border-collapse: collapse; width: 100%;">',
+    '<tbody>'
+])
+_HTML_SUFFIX = '</tbody>\n</table>'
+_HTML_SPACER_ROW = '<tr><td style="padding: 8px; border: none;">&nbsp;</td><td style="padding: 8px; border: none;">&nbsp;</td></tr>'
+_HTML_SECTION_ROW = '<tr><td colspan="2" style="padding: 8px; font-weight: bold; background-color: #e0e0e0; font-size: 14px;"><strong><b>{}</b></strong></td></tr>'
+_HTML_ROW = '<tr><td style="padding: 8px;">{}</td><td style="padding: 8px;">{}</td></tr>'
+
+# Communities a new deposition is added to unless the caller sets its own
+_DEFAULT_COMMUNITIES = ({"identifier": "microed"},)
+
+# Display order of parameter sections in the HTML table
+_SECTION_ORDER = ("General", "Instrumental", "Experimental", "Sample description", "Software & Files", "Other")
+
+@dataclass(slots=True)
 class Funding:
     funder: str  # Funder name or DOI prefix (e.g., "European Commission", "10.13039/501100000780")
     award_number: str  # Grant/award number
     award_title: Optional[str] = None
     url: Optional[str] = None  # URL to grant information
     _validated_doi: Optional[str] = None  # Cached DOI from API validation
+    # Last computed grant id and the (funder, award_number, _validated_doi) it was built from
+    _grant_id_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def validate(self, sandbox: bool = False) -> bool:
         """
@@ -68,10 +90,11 @@ class Funding:
             return True  # Assume DOI prefixes are valid
         
         # Check if it's in the curated list
-        if self.funder in COMPREHENSIVE_FUNDERS:
+        if self.funder in _FUNDER_NAME_SET:
             return True
         
-        # Try API validation
+        # Try API validation (imported here: it pulls in requests)
+        from .metadata_validation import validate_funder_api
         doi_prefix = validate_funder_api(self.funder, sandbox)
         if doi_prefix:
             self._validated_doi = doi_prefix
@@ -87,6 +110,11 @@ class Funding:
         - Just the award number: "283595"
         - Or with DOI prefix: "10.13039/501100000780::283595"
         """
+        key = (self.funder, self.award_number, self._validated_doi)
+        cache = self._grant_id_cache
+        if cache is not None and cache[0] == key:
+            return {"id": cache[1]}
+        
         # Check if funder looks like a DOI prefix
         if self.funder.startswith("10.13039/"):
             # Use DOI prefix format: "DOI_PREFIX::AWARD_NUMBER"
@@ -103,15 +131,16 @@ class Funding:
                 # For unknown funders, use just the award number
                 # (Zenodo will try to match the funder name)
                 grant_id = self.award_number
-                
+        
+        self._grant_id_cache = (key, grant_id)
         return {"id": grant_id}
     
     @classmethod
     def get_common_funders(cls) -> List[str]:
         """Get list of common funder names for autocomplete"""
-        return list(COMPREHENSIVE_FUNDERS.keys())
+        return list(_FUNDER_NAMES)
 
-@dataclass
+@dataclass(slots=True)
 class Creator:
     name: str
     affiliation: Optional[str] = None
@@ -125,7 +154,10 @@ class Creator:
             data["orcid"] = self.orcid
         return data
 
-@dataclass
+# Alternative name for Creator (same class, so isinstance checks agree)
+Author = Creator
+
+@dataclass(slots=True)
 class Contributor:
     """Contributor class - for future use when contributors API is implemented
     Note: Currently commented out in GUI as Zenodo contributors API requires additional setup"""
@@ -144,7 +176,7 @@ class Contributor:
             data["type"] = self.type
         return data
 
-@dataclass
+@dataclass(slots=True)
 class EDParameters:
     """Electron Diffraction specific parameters - now supports dynamic parameters"""
     parameters: Optional[Dict[str, str]] = field(default_factory=dict)
@@ -198,8 +230,8 @@ class EDParameters:
             table_format: Custom table format specification  
             format_type: Output format - "html" (default) or "markdown"
         """
-        # Check if any parameter has a value
-        if not self.parameters or not any(v for v in self.parameters.values() if v):
+        # The table generators return "" when no parameter has a value
+        if not self.parameters:
             return ""
 
         # Use direct HTML table generation for simplicity with dynamic parameters
@@ -228,71 +260,58 @@ class EDParameters:
         if not sections:
             return ""
             
-        table_lines = [
-            '<p>The table below summarizes the data collection parameters:</p>',
-            '<table border="1" style="border-collapse: collapse; width: 100%;">',
-            '<tbody>'
-        ]
+        table_lines = []
         
-        # Sort sections for consistent ordering (put "General" last)
-        section_order = ["General", "Instrumental", "Experimental", "Sample description", "Software & Files", "Other"]
-        ordered_sections = []
-        for section in section_order:
-            if section in sections:
-                ordered_sections.append(section)
-        # Add any remaining sections not in the predefined order (like "General")
-        for section in sections:
-            if section not in ordered_sections:
-                ordered_sections.append(section)
+        # Sort sections for consistent ordering; sections not in the
+        # predefined order follow in the order they were first seen
+        ordered_sections = [section for section in _SECTION_ORDER if section in sections]
+        ordered_sections.extend(section for section in sections if section not in _SECTION_ORDER)
         
         first_section = True
         for section_name in ordered_sections:
-            if section_name not in sections:
-                continue
-                
             # Add empty row for spacing between sections (except before first section)
             if not first_section:
-                table_lines.append('<tr><td style="padding: 8px; border: none;">&nbsp;</td><td style="padding: 8px; border: none;">&nbsp;</td></tr>')
+                table_lines.append(_HTML_SPACER_ROW)
             
             # Add section header with stronger bold styling
-            table_lines.append(f'<tr><td colspan="2" style="padding: 8px; font-weight: bold; background-color: #e0e0e0; font-size: 14px;"><strong><b>{section_name}</b></strong></td></tr>')
+            table_lines.append(_HTML_SECTION_ROW.format(section_name))
             
             # Add parameters in this section
-            for key, value in sections[section_name]:
+            table_lines.extend(
                 # Convert newlines to HTML breaks for multiline entries
-                formatted_value = value.replace('\n', '<br>') if '\n' in value else value
-                table_lines.append(
-                    f'<tr><td style="padding: 8px;">{key}</td>'
-                    f'<td style="padding: 8px;">{formatted_value}</td></tr>'
-                )
+                _HTML_ROW.format(key, value.replace('\n', '<br>'))
+                for key, value in sections[section_name]
+            )
                 
             first_section = False
         
-        table_lines.extend(['</tbody>', '</table>'])
-        return '\n'.join(table_lines)
+        return '\n'.join([_HTML_PREFIX, *table_lines, _HTML_SUFFIX])
     
     def _generate_markdown_table(self) -> str:
         """Generate markdown table from parameters"""
         if not self.parameters:
             return ""
             
+        # Add rows for each parameter that has a value
+        rows = []
+        for key, value in self.parameters.items():
+            if value:  # Only include non-empty values
+                # Handle multiline values in markdown
+                formatted_value = value.replace('\n', '<br>')
+                rows.append(f"| {key} | {formatted_value} |")
+        if not rows:
+            return ""
+        
         lines = [
             "The table below summarizes the data collection parameters:",
             "",
             "| Parameter | Value |",
             "|-----------|-------|"
         ]
-        
-        # Add rows for each parameter that has a value
-        for key, value in self.parameters.items():
-            if value:  # Only include non-empty values
-                # Handle multiline values in markdown
-                formatted_value = value.replace('\n', '<br>') if '\n' in value else value
-                lines.append(f"| {key} | {formatted_value} |")
-        
+        lines.extend(rows)
         return '\n'.join(lines)
 
-@dataclass
+@dataclass(slots=True)
 class ZenodoMetadata:
     title: str
     description: str
@@ -301,8 +320,8 @@ class ZenodoMetadata:
     access_right: str = "open"
     license: Optional[str] = None
     keywords: List[str] = field(default_factory=list)
-    communities: List[Dict[str, str]] = field(default_factory=lambda: [{"identifier": "microed"}])
-    publication_date: str = field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d'))
+    communities: List[Dict[str, str]] = field(default_factory=lambda: [dict(c) for c in _DEFAULT_COMMUNITIES])
+    publication_date: str = ""  # Empty means today's date, filled in by to_dict
     notes: Optional[str] = None
     contributors: List[Contributor] = field(default_factory=list)
     ed_parameters: Optional[EDParameters] = None
@@ -328,6 +347,7 @@ class ZenodoMetadata:
         
         # Validate communities (skip in sandbox mode)
         if not sandbox:
+            from .metadata_validation import validate_community_api
             for community in self.communities:
                 community_id = community.get("identifier")
                 if community_id and not validate_community_api(community_id, sandbox):
@@ -355,7 +375,7 @@ class ZenodoMetadata:
             'description': self.description,
             'upload_type': self.upload_type,
             'access_right': self.access_right,
-            'publication_date': self.publication_date,
+            'publication_date': self.publication_date or datetime.now().strftime('%Y-%m-%d'),
             'creators': [creator.to_dict() for creator in self.creators],
             'communities': self.communities
         }
@@ -13,6 +13,13 @@ from datetime import datetime
 
 from ..core.interfaces import MetadataValidator, ValidationError
 
+# ORCID format: 0000-0000-0000-0000 (where last digit can be X)
+_ORCID_RE = re.compile(r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$')
+
+# Shape of a YYYY-MM-DD date (month and day may have one or two digits), used
+# to reject malformed input before parsing it
+_DATE_RE = re.compile(r'(\d{4})-([0-9]{1,2})-([0-9]{1,2})')
+
 
 class ZenodoMetadataValidator(MetadataValidator):
     """Metadata validator for Zenodo uploads"""
@@ -30,9 +37,44 @@ class ZenodoMetadataValidator(MetadataValidator):
         'publication', 'poster', 'presentation', 'dataset', 
         'image', 'video', 'software', 'lesson', 'physicalobject', 'other'
     }
+    _VALID_UPLOAD_TYPES_MSG = ', '.join(sorted(VALID_UPLOAD_TYPES))
     
     # Valid access rights
     VALID_ACCESS_RIGHTS = {'open', 'embargoed', 'restricted', 'closed'}
+    _VALID_ACCESS_RIGHTS_MSG = ', '.join(sorted(VALID_ACCESS_RIGHTS))
+    
+    # Fields counted by _estimate_quality: required fields, then optional but
+    # valuable ones
+    _SCORED_FIELDS = tuple(REQUIRED_FIELDS) + (
+        'keywords', 'communities', 'license', 'access_right',
+        'publication_date', 'notes'
+    )
+    
+    # Quality label by score (0-10)
+    _QUALITY_LABELS = (
+        ('Poor',) * 5 + ('Fair',) * 2 + ('Good',) * 2 + ('Excellent',) * 2
+    )
+    
+    # Per-field validators, in the order their messages are reported.
+    # Fields listed in REQUIRED_FIELDS are presence/type checked by validate()
+    # before their validator runs; optional fields are skipped when None.
+    _FIELD_VALIDATORS = (
+        ('title', '_validate_title'),
+        ('description', '_validate_description'),
+        ('creators', '_validate_creators'),
+        ('upload_type', '_validate_upload_type'),
+        ('access_right', '_validate_access_right'),
+        ('keywords', '_validate_keywords'),
+        ('communities', '_validate_communities'),
+        ('publication_date', '_validate_publication_date'),
+    )
+    
+    def __init__(self):
+        """Bind the per-field validators once so validate() is a single pass"""
+        self._validators = tuple(
+            (field, self.REQUIRED_FIELDS.get(field), getattr(self, method_name))
+            for field, method_name in self._FIELD_VALIDATORS
+        )
     
     def validate(self, metadata: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -44,67 +86,80 @@ class ZenodoMetadataValidator(MetadataValidator):
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
+        errors, _ = self._validate_fields(metadata)
+        return len(errors) == 0, errors
+    
+    def _validate_fields(self, metadata: Dict[str, Any]) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Run the single validation pass
         
-        # Check required fields
-        for field, expected_type in self.REQUIRED_FIELDS.items():
-            if field not in metadata:
-                errors.append(f"Required field missing: {field}")
-                continue
+        Args:
+            metadata: Metadata dictionary to validate
             
-            if not isinstance(metadata[field], expected_type):
-                errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
+        Returns:
+            Tuple of (error_messages, counts); counts holds the number of
+            missing required fields and the item counts of the list fields
+        """
+        errors = []
+        field_errors = []
+        counts = {'missing_required': 0, 'creators': 0, 'keywords': 0, 'communities': 0}
+        
+        for field, expected_type, validator in self._validators:
+            if expected_type is not None:
+                # Check required fields
+                if field not in metadata:
+                    errors.append(f"Required field missing: {field}")
+                    counts['missing_required'] += 1
+                    continue
+                
+                value = metadata[field]
+                if not isinstance(value, expected_type):
+                    errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
+                    continue
+            else:
+                value = metadata.get(field)
+                if value is None:
+                    continue  # Optional field
+            
+            if field in counts and isinstance(value, list):
+                counts[field] = len(value)
+            
+            # Validate specific fields (validators return None when valid)
+            field_result = validator(value)
+            if field_result:
+                field_errors.extend(field_result)
         
-        # Validate specific fields
-        errors.extend(self._validate_title(metadata.get('title')))
-        errors.extend(self._validate_description(metadata.get('description')))
-        errors.extend(self._validate_creators(metadata.get('creators')))
-        errors.extend(self._validate_upload_type(metadata.get('upload_type')))
-        errors.extend(self._validate_access_right(metadata.get('access_right')))
-        errors.extend(self._validate_keywords(metadata.get('keywords')))
-        errors.extend(self._validate_communities(metadata.get('communities')))
-        errors.extend(self._validate_publication_date(metadata.get('publication_date')))
+        # Required-field problems are reported before field-specific ones
+        errors.extend(field_errors)
         
-        return len(errors) == 0, errors
+        return errors, counts
     
-    def _validate_title(self, title: Any) -> List[str]:
+    def _validate_title(self, title: str) -> Optional[List[str]]:
         """Validate title field"""
-        errors = []
-        if not isinstance(title, str):
-            return errors  # Type error already caught
-        
         if not title.strip():
-            errors.append("Title cannot be empty")
+            return ["Title cannot be empty"]
         elif len(title.strip()) < 3:
-            errors.append("Title must be at least 3 characters long")
+            return ["Title must be at least 3 characters long"]
         elif len(title) > 250:
-            errors.append("Title cannot exceed 250 characters")
+            return ["Title cannot exceed 250 characters"]
         
-        return errors
+        return None
     
-    def _validate_description(self, description: Any) -> List[str]:
+    def _validate_description(self, description: str) -> Optional[List[str]]:
         """Validate description field"""
-        errors = []
-        if not isinstance(description, str):
-            return errors  # Type error already caught
-        
         if not description.strip():
-            errors.append("Description cannot be empty")
+            return ["Description cannot be empty"]
         elif len(description.strip()) < 10:
-            errors.append("Description must be at least 10 characters long")
+            return ["Description must be at least 10 characters long"]
         
-        return errors
+        return None
     
-    def _validate_creators(self, creators: Any) -> List[str]:
+    def _validate_creators(self, creators: list) -> Optional[List[str]]:
         """Validate creators field"""
-        errors = []
-        if not isinstance(creators, list):
-            return errors  # Type error already caught
-        
         if not creators:
-            errors.append("At least one creator is required")
-            return errors
+            return ["At least one creator is required"]
         
+        errors = []
         for i, creator in enumerate(creators):
             if not isinstance(creator, dict):
                 errors.append(f"Creator {i+1} must be a dictionary")
@@ -121,64 +176,47 @@ class ZenodoMetadataValidator(MetadataValidator):
                 if not self._is_valid_orcid(creator['orcid']):
                     errors.append(f"Creator {i+1} has invalid ORCID format")
         
-        return errors
+        return errors or None
     
-    def _validate_upload_type(self, upload_type: Any) -> List[str]:
+    def _validate_upload_type(self, upload_type: str) -> Optional[List[str]]:
         """Validate upload_type field"""
-        errors = []
-        if not isinstance(upload_type, str):
-            return errors
-        
         if upload_type not in self.VALID_UPLOAD_TYPES:
-            errors.append(f"Invalid upload_type '{upload_type}'. "
-                         f"Must be one of: {', '.join(sorted(self.VALID_UPLOAD_TYPES))}")
+            return [f"Invalid upload_type '{upload_type}'. "
+                    f"Must be one of: {self._VALID_UPLOAD_TYPES_MSG}"]
         
-        return errors
+        return None
     
-    def _validate_access_right(self, access_right: Any) -> List[str]:
+    def _validate_access_right(self, access_right: Any) -> Optional[List[str]]:
         """Validate access_right field"""
-        errors = []
-        if access_right is None:
-            return errors  # Optional field
-        
         if not isinstance(access_right, str):
-            errors.append("access_right must be a string")
-            return errors
+            return ["access_right must be a string"]
         
         if access_right not in self.VALID_ACCESS_RIGHTS:
-            errors.append(f"Invalid access_right '{access_right}'. "
-                         f"Must be one of: {', '.join(sorted(self.VALID_ACCESS_RIGHTS))}")
+            return [f"Invalid access_right '{access_right}'. "
+                    f"Must be one of: {self._VALID_ACCESS_RIGHTS_MSG}"]
         
-        return errors
+        return None
     
-    def _validate_keywords(self, keywords: Any) -> List[str]:
+    def _validate_keywords(self, keywords: Any) -> Optional[List[str]]:
         """Validate keywords field"""
-        errors = []
-        if keywords is None:
-            return errors  # Optional field
-        
         if not isinstance(keywords, list):
-            errors.append("Keywords must be a list")
-            return errors
+            return ["Keywords must be a list"]
         
+        errors = []
         for i, keyword in enumerate(keywords):
             if not isinstance(keyword, str):
                 errors.append(f"Keyword {i+1} must be a string")
             elif not keyword.strip():
                 errors.append(f"Keyword {i+1} cannot be empty")
         
-        return errors
+        return errors or None
     
-    def _validate_communities(self, communities: Any) -> List[str]:
+    def _validate_communities(self, communities: Any) -> Optional[List[str]]:
         """Validate communities field"""
-        errors = []
-        if communities is None:
-            return errors  # Optional field
-        
         if not isinstance(communities, list):
-            errors.append("Communities must be a list")
-            return errors
+            return ["Communities must be a list"]
         
+        errors = []
         for i, community in enumerate(communities):
             if not isinstance(community, dict):
                 errors.append(f"Community {i+1} must be a dictionary")
@@ -189,32 +227,37 @@ class ZenodoMetadataValidator(MetadataValidator):
             elif not community['identifier'].strip():
                 errors.append(f"Community {i+1} identifier cannot be empty")
         
-        return errors
+        return errors or None
     
-    def _validate_publication_date(self, pub_date: Any) -> List[str]:
+    def _validate_publication_date(self, pub_date: Any) -> Optional[List[str]]:
         """Validate publication_date field"""
-        errors = []
-        if pub_date is None:
-            return errors  # Optional field
-        
         if not isinstance(pub_date, str):
-            errors.append("Publication date must be a string")
-            return errors
+            return ["Publication date must be a string"]
         
         # Check date format (YYYY-MM-DD)
+        if not self._is_valid_date(pub_date):
+            return [f"Invalid publication date format '{pub_date}'. "
+                    "Expected format: YYYY-MM-DD"]
+        
+        return None
+    
+    def _is_valid_date(self, date: str) -> bool:
+        """Check if date is a valid YYYY-MM-DD date"""
+        match = _DATE_RE.fullmatch(date)
+        if match is None:
+            return False
+        # Construct directly instead of strptime; datetime() still rejects
+        # out-of-range months and days
+        year, month, day = match.groups()
         try:
-            datetime.strptime(pub_date, '%Y-%m-%d')
+            datetime(int(year), int(month), int(day))
         except ValueError:
-            errors.append(f"Invalid publication date format '{pub_date}'. "
-                         "Expected format: YYYY-MM-DD")
-        
-        return errors
+            return False
+        return True
     
     def _is_valid_orcid(self, orcid: str) -> bool:
         """Check if ORCID format is valid"""
-        # ORCID format: 0000-0000-0000-0000 (where last digit can be X)
-        pattern = r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$'
-        return bool(re.match(pattern, orcid))
+        return _ORCID_RE.match(orcid) is not None
     
     def get_validation_summary(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -226,52 +269,24 @@ class ZenodoMetadataValidator(MetadataValidator):
         Returns:
             Dictionary with validation summary
         """
-        is_valid, errors = self.validate(metadata)
+        errors, counts = self._validate_fields(metadata)
         
         return {
-            'valid': is_valid,
+            'valid': len(errors) == 0,
             'error_count': len(errors),
             'errors': errors,
-            'has_required_fields': all(
-                field in metadata for field in self.REQUIRED_FIELDS
-            ),
-            'creator_count': len(metadata.get('creators', [])),
-            'keyword_count': len(metadata.get('keywords', [])),
-            'community_count': len(metadata.get('communities', [])),
+            'has_required_fields': counts['missing_required'] == 0,
+            'creator_count': counts['creators'],
+            'keyword_count': counts['keywords'],
+            'community_count': counts['communities'],
             'estimated_quality': self._estimate_quality(metadata)
         }
     
     def _estimate_quality(self, metadata: Dict[str, Any]) -> str:
         """Estimate metadata quality based on completeness"""
-        score = 0
-        max_score = 10
-        
-        # Required fields (4 points)
-        for field in self.REQUIRED_FIELDS:
-            if field in metadata and metadata[field]:
-                score += 1
-        
-        # Optional but valuable fields (6 points)
-        optional_fields = [
-            'keywords', 'communities', 'license', 'access_right',
-            'publication_date', 'notes'
-        ]
-        
-        for field in optional_fields:
-            if field in metadata and metadata[field]:
-                score += 1
-                if score >= max_score:
-                    break
-        
-        # Quality assessment
-        if score >= 9:
-            return "Excellent"
-        elif score >= 7:
-            return "Good"
-        elif score >= 5:
-            return "Fair"
-        else:
-            return "Poor"
+        # One point per non-empty field: required (4) plus optional (6)
+        score = sum(1 for field in self._SCORED_FIELDS if metadata.get(field))
+        return self._QUALITY_LABELS[score]
 
 
 def validate_funder_api(funder_name: str, sandbox: bool = False) -> Optional[str]:
@@ -20,6 +20,7 @@ from typing import Dict, Any, Optional
 from PyQt6.QtCore import QSettings
 
 from ..core.interfaces import SettingsManager, SettingsError
+from .user_config import encode_json
 
 
 class QtSettingsManager(SettingsManager):
@@ -47,6 +48,9 @@ class QtSettingsManager(SettingsManager):
         }
     }
     
+    # DEFAULT_SETTINGS flattened to dot-notation keys, computed on first use
+    _FLAT_DEFAULTS: Optional[Dict[str, Any]] = None
+    
     def __init__(self, organization: str = "ZenodoUploader", 
                  application: str = "ElectronDiffraction"):
         """
@@ -59,11 +63,16 @@ class QtSettingsManager(SettingsManager):
         self.settings = QSettings(organization, application)
         self._cache = {}
         self._load_cache()
+        # Set when the cache may no longer mirror QSettings, so load_settings
+        # only re-reads the backend after a write
+        self._dirty = False
     
     def load_settings(self) -> Dict[str, Any]:
         """Load all application settings"""
         try:
-            self._load_cache()
+            if self._dirty:
+                self._load_cache()
+                self._dirty = False
             return self._cache.copy()
         except Exception as e:
             raise SettingsError(f"Failed to load settings: {e}")
@@ -72,6 +81,7 @@ class QtSettingsManager(SettingsManager):
         """Save application settings"""
         try:
             self._cache = settings.copy()
+            self._dirty = True
             self._save_cache()
         except Exception as e:
             raise SettingsError(f"Failed to save settings: {e}")
@@ -107,6 +117,7 @@ class QtSettingsManager(SettingsManager):
         try:
             self.settings.setValue(key, value)
             self._update_cache_key(key, value)
+            self._dirty = True
         except Exception as e:
             raise SettingsError(f"Failed to set setting '{key}': {e}")
     
@@ -114,9 +125,9 @@ class QtSettingsManager(SettingsManager):
         """Reset all settings to defaults"""
         try:
             self.settings.clear()
-            self._cache = self._flatten_dict(self.DEFAULT_SETTINGS).copy()
-            for key, value in self._cache.items():
-                self.settings.setValue(key, value)
+            self._cache = self._get_flat_defaults().copy()
+            self._dirty = True
+            self._save_cache()
         except Exception as e:
             raise SettingsError(f"Failed to reset settings: {e}")
     
@@ -128,9 +139,7 @@ class QtSettingsManager(SettingsManager):
             file_path: Path to export file
         """
         try:
-            settings_dict = self.load_settings()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(settings_dict, f, indent=2, ensure_ascii=False)
+            Path(file_path).write_bytes(encode_json(self.load_settings()))
         except Exception as e:
             raise SettingsError(f"Failed to export settings: {e}")
     
@@ -159,18 +168,15 @@ class QtSettingsManager(SettingsManager):
         """Load settings into cache"""
         self._cache = {}
         
-        # Load defaults first
-        defaults = self._flatten_dict(self.DEFAULT_SETTINGS)
-        
-        # Load all keys from QSettings
-        for key in defaults.keys():
-            value = self.settings.value(key, defaults[key])
-            self._cache[key] = value
+        # Load all keys from QSettings, falling back to the defaults
+        for key, default in self._get_flat_defaults().items():
+            self._cache[key] = self.settings.value(key, default)
     
     def _save_cache(self) -> None:
-        """Save cache to QSettings"""
+        """Save cache to QSettings, flushing once after all keys are written"""
+        set_value = self.settings.setValue
         for key, value in self._cache.items():
-            self.settings.setValue(key, value)
+            set_value(key, value)
         self.settings.sync()
     
     def _update_cache_key(self, key: str, value: Any) -> None:
@@ -179,19 +185,34 @@ class QtSettingsManager(SettingsManager):
     
     def _get_default_for_key(self, key: str) -> Any:
         """Get default value for a key"""
-        defaults = self._flatten_dict(self.DEFAULT_SETTINGS)
-        return defaults.get(key)
+        return self._get_flat_defaults().get(key)
+    
+    def _get_flat_defaults(self) -> Dict[str, Any]:
+        """Get the flattened DEFAULT_SETTINGS, flattening them once per class"""
+        cls = type(self)
+        flat_defaults = cls.__dict__.get('_FLAT_DEFAULTS')
+        if flat_defaults is None:
+            flat_defaults = self._flatten_dict(cls.DEFAULT_SETTINGS)
+            cls._FLAT_DEFAULTS = flat_defaults
+        return flat_defaults
     
     def _flatten_dict(self, d: Dict[str, Any], parent_key: str = '') -> Dict[str, Any]:
         """Flatten nested dictionary with dot notation keys"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}.{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key).items())
+        flat = {}
+        # Depth-first walk with a stack of item iterators instead of recursion,
+        # so keys keep the same order as the nested dictionary
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}.{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
 
 
 class DefaultMetadataProvider:
@@ -235,8 +256,7 @@ class DefaultMetadataProvider:
             # Ensure directory exists
             self.default_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.default_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self.default_file.write_bytes(encode_json(metadata))
         except Exception as e:
             raise SettingsError(f"Failed to save default metadata: {e}")
     
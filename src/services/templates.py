@@ -5,13 +5,32 @@ This module provides clean data structures for handling metadata templates
 without GUI dependencies.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+import copy
 import json
+import warnings
 
+from .user_config import encode_json
 
-@dataclass
+
+# Legacy ED parameter field names (old template format / attributes) -> parameter names
+_LEGACY_ED_FIELD_MAP = {
+    'instrument': 'Instrument',
+    'detector': 'Detector',
+    'collection_mode': 'Collection Mode',
+    'voltage': 'Accelerating Voltage',
+    'wavelength': 'Wavelength',
+    'exposure_time': 'Exposure Time',
+    'rotation_range': 'Rotation Range',
+    'temperature': 'Temperature',
+    'crystal_size': 'Crystal Size',
+    'sample_composition': 'Sample Composition'
+}
+
+
+@dataclass(slots=True)
 class TemplateCreator:
     """Creator data for templates (creators only - no type field)"""
     name: str = ""
@@ -19,7 +38,7 @@ class TemplateCreator:
     orcid: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateContributor:
     """Contributor data for templates (future use - currently inactive)
     Note: Contributors API requires additional Zenodo setup"""
@@ -29,7 +48,7 @@ class TemplateContributor:
     type: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateFunding:
     """Funding data for templates"""
     funder: str = ""
@@ -38,101 +57,51 @@ class TemplateFunding:
     url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateCommunity:
     """Community data for templates"""
     identifier: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateEDParameters:
     """Measurement parameters for templates - now dynamic"""
     # Store as a simple dictionary to allow any number of parameters
     parameters: Dict[str, str] = field(default_factory=dict)
     
-    # Legacy properties for backward compatibility
-    @property
-    def instrument(self) -> str:
-        return self.parameters.get("Instrument", "")
-    
-    @instrument.setter
-    def instrument(self, value: str):
-        self.parameters["Instrument"] = value
-    
-    @property
-    def detector(self) -> str:
-        return self.parameters.get("Detector", "")
-    
-    @detector.setter
-    def detector(self, value: str):
-        self.parameters["Detector"] = value
-    
-    @property
-    def collection_mode(self) -> str:
-        return self.parameters.get("Collection Mode", "")
-    
-    @collection_mode.setter
-    def collection_mode(self, value: str):
-        self.parameters["Collection Mode"] = value
-    
-    @property
-    def voltage(self) -> str:
-        return self.parameters.get("Accelerating Voltage", "")
-    
-    @voltage.setter
-    def voltage(self, value: str):
-        self.parameters["Accelerating Voltage"] = value
-    
-    @property
-    def wavelength(self) -> str:
-        return self.parameters.get("Wavelength", "")
-    
-    @wavelength.setter
-    def wavelength(self, value: str):
-        self.parameters["Wavelength"] = value
-    
-    @property
-    def exposure_time(self) -> str:
-        return self.parameters.get("Exposure Time", "")
-    
-    @exposure_time.setter
-    def exposure_time(self, value: str):
-        self.parameters["Exposure Time"] = value
+    def get(self, name: str, default: str = "") -> str:
+        """Get a parameter value by its display name (e.g. 'Instrument')"""
+        return self.parameters.get(name, default)
     
-    @property
-    def rotation_range(self) -> str:
-        return self.parameters.get("Rotation Range", "")
+    # Legacy attributes for backward compatibility, dispatched through the
+    # field map instead of one property pair per field. Deprecated: use
+    # get() or the parameters dict instead.
+    def __getattr__(self, name: str) -> str:
+        key = _LEGACY_ED_FIELD_MAP.get(name)
+        if key is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        _warn_legacy_ed_field(name, key)
+        return self.parameters.get(key, "")
     
-    @rotation_range.setter
-    def rotation_range(self, value: str):
-        self.parameters["Rotation Range"] = value
-    
-    @property
-    def temperature(self) -> str:
-        return self.parameters.get("Temperature", "")
-    
-    @temperature.setter
-    def temperature(self, value: str):
-        self.parameters["Temperature"] = value
-    
-    @property
-    def crystal_size(self) -> str:
-        return self.parameters.get("Crystal Size", "")
-    
-    @crystal_size.setter
-    def crystal_size(self, value: str):
-        self.parameters["Crystal Size"] = value
-    
-    @property
-    def sample_composition(self) -> str:
-        return self.parameters.get("Sample Composition", "")
-    
-    @sample_composition.setter
-    def sample_composition(self, value: str):
-        self.parameters["Sample Composition"] = value
+    def __setattr__(self, name: str, value: Any):
+        key = _LEGACY_ED_FIELD_MAP.get(name)
+        if key is None:
+            object.__setattr__(self, name, value)
+        else:
+            _warn_legacy_ed_field(name, key)
+            self.parameters[key] = value
 
 
-@dataclass
+def _warn_legacy_ed_field(name: str, key: str) -> None:
+    """Warn about access to a deprecated TemplateEDParameters attribute"""
+    warnings.warn(
+        f"TemplateEDParameters.{name} is deprecated; use parameters[{key!r}] or get({key!r})",
+        DeprecationWarning,
+        stacklevel=3
+    )
+
+
+@dataclass(slots=True)
 class MetadataTemplate:
     """Complete metadata template structure"""
     title: str = ""
@@ -153,7 +122,33 @@ class MetadataTemplate:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        # Built by hand rather than with dataclasses.asdict, which deep-copies
+        # every value via field introspection; containers are still copied
+        return {
+            'title': self.title,
+            'description': self.description,
+            'upload_type': self.upload_type,
+            'access_right': self.access_right,
+            'license': self.license,
+            'keywords': list(self.keywords),
+            'notes': self.notes,
+            'publication_date': self.publication_date,
+            'creators': [
+                {'name': c.name, 'affiliation': c.affiliation, 'orcid': c.orcid}
+                for c in self.creators
+            ],
+            'contributors': [
+                {'name': c.name, 'affiliation': c.affiliation, 'orcid': c.orcid, 'type': c.type}
+                for c in self.contributors
+            ],
+            'grants': [
+                {'funder': g.funder, 'award_number': g.award_number,
+                 'award_title': g.award_title, 'url': g.url}
+                for g in self.grants
+            ],
+            'communities': [{'identifier': c.identifier} for c in self.communities],
+            'ed_parameters': {'parameters': dict(self.ed_parameters.parameters)}
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MetadataTemplate':
@@ -187,20 +182,7 @@ class MetadataTemplate:
             else:
                 # Old format - convert to new format
                 parameters = {}
-                field_mapping = {
-                    'instrument': 'Instrument',
-                    'detector': 'Detector',
-                    'collection_mode': 'Collection Mode',
-                    'voltage': 'Accelerating Voltage',
-                    'wavelength': 'Wavelength',
-                    'exposure_time': 'Exposure Time',
-                    'rotation_range': 'Rotation Range',
-                    'temperature': 'Temperature',
-                    'crystal_size': 'Crystal Size',
-                    'sample_composition': 'Sample Composition'
-                }
-                
-                for old_field, new_field in field_mapping.items():
+                for old_field, new_field in _LEGACY_ED_FIELD_MAP.items():
                     if old_field in ed_params_data and ed_params_data[old_field]:
                         parameters[new_field] = ed_params_data[old_field]
                 
@@ -238,19 +220,32 @@ class TemplateService:
             # Default to templates/ directory relative to this file
             templates_dir = Path(__file__).parent.parent.parent / "templates"
         self.templates_dir = templates_dir
+        # Parsed templates keyed by path, with the (mtime, size) they were read at
+        self._cache: Dict[Path, tuple] = {}
     
     def load_template(self, filename: str) -> MetadataTemplate:
         """Load template from file"""
         file_path = self.templates_dir / filename
         
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             # Return default template if file doesn't exist
             return MetadataTemplate()
         
+        # Reuse the parsed template while the file is unchanged; callers get a
+        # copy so they cannot modify the cached instance
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            return copy.deepcopy(cached[1])
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return MetadataTemplate.from_dict(data)
+            template = MetadataTemplate.from_dict(data)
+            self._cache[file_path] = (version, template)
+            return copy.deepcopy(template)
         except Exception as e:
             print(f"Failed to load template {filename}: {e}")
             return MetadataTemplate()
@@ -261,8 +256,9 @@ class TemplateService:
             self.templates_dir.mkdir(exist_ok=True)
             file_path = self.templates_dir / filename
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(template.to_dict(), f, indent=4, ensure_ascii=False)
+            # Don't rely on mtime alone (coarse on some filesystems)
+            self._cache.pop(file_path, None)
+            file_path.write_bytes(encode_json(template.to_dict()))
             return True
         except Exception as e:
             print(f"Failed to save template {filename}: {e}")
@@ -5,15 +5,34 @@ Manages the complete upload workflow including validation, progress tracking,
 and error handling.
 """
 
+import asyncio
+import hashlib
+import json
 import threading
-from typing import Dict, Any, Optional, Callable
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
 from enum import Enum
 
 from ..core.interfaces import (
     UploadService, RepositoryAPI, FileValidator, MetadataValidator,
-    ProgressCallback, StatusCallback, UploadError
+    ProgressCallback, StatusCallback, UploadError, APIError, FileInfo
 )
+from .user_config import (
+    get_uploads_cache_path, get_uploads_resume_path, load_json_config, save_json_config
+)
+
+
+# Maximum number of files uploaded concurrently into one deposition
+MAX_PARALLEL_UPLOADS = 4
+
+# Minimum time between two progress callbacks (a changed percentage is held
+# back until it has elapsed; 100% is always delivered)
+PROGRESS_UPDATE_INTERVAL_S = 0.1
+
+# Number of previous uploads remembered in the uploads cache (oldest dropped first)
+UPLOAD_CACHE_MAX_ENTRIES = 500
 
 
 class UploadStatus(Enum):
@@ -28,6 +47,231 @@ class UploadStatus(Enum):
     FAILED = "failed"
 
 
+class StatusReporter:
+    """
+    Delivers progress and status updates of one upload run
+    
+    Callback errors are swallowed so they can't break the upload, nothing is
+    reported once the cancel event is set, and progress callbacks are
+    throttled: a changed percentage is passed on at most once per interval
+    (100% is always delivered). The latest percentage and message are kept
+    for consumers that poll instead (see state).
+    """
+    
+    __slots__ = ('_progress_callback', '_status_callback', '_cancel_event', '_interval_s',
+                 '_last_ts', '_last_pct', '_pct', '_msg', '_lock')
+    
+    def __init__(self,
+                 progress_callback: Optional[ProgressCallback] = None,
+                 status_callback: Optional[StatusCallback] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 interval_s: float = PROGRESS_UPDATE_INTERVAL_S):
+        """
+        Initialize status reporter
+        
+        Args:
+            progress_callback: Optional progress reporting callback
+            status_callback: Optional status update callback
+            cancel_event: Event that silences the reporter once set
+            interval_s: Minimum seconds between progress callbacks (0 to
+                report every change)
+        """
+        self._progress_callback = progress_callback
+        self._status_callback = status_callback
+        self._cancel_event = cancel_event
+        self._interval_s = interval_s
+        self._last_ts = 0.0
+        self._last_pct: Optional[int] = None
+        self._pct = 0
+        self._msg = ''
+        self._lock = threading.Lock()
+    
+    def progress(self, percentage: int) -> None:
+        """Report overall progress"""
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            return
+        callback = self._progress_callback
+        with self._lock:
+            self._pct = percentage
+            if callback is None or percentage == self._last_pct:
+                return
+            now = time.monotonic()
+            if percentage != 100 and now - self._last_ts < self._interval_s:
+                return
+            self._last_pct = percentage
+            self._last_ts = now
+        try:
+            callback(percentage)
+        except Exception:
+            pass  # Don't let callback errors break the upload
+    
+    def status(self, message: str) -> None:
+        """Report a status message"""
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            return
+        with self._lock:
+            self._msg = message
+        if self._status_callback:
+            try:
+                self._status_callback(message)
+            except Exception:
+                pass  # Don't let callback errors break the upload
+    
+    def state(self) -> tuple[int, str]:
+        """Get the latest (percentage, status message)"""
+        with self._lock:
+            return self._pct, self._msg
+
+
+def _upload_key(file_infos: List[FileInfo], metadata: Dict[str, Any], publish: bool) -> str:
+    """
+    Build the key identifying an upload in UploadCache and ResumeLedger
+    
+    The key covers the uploaded files (name, size, modification time), the
+    metadata and whether the deposition is published.
+    
+    Args:
+        file_infos: Files of the upload
+        metadata: Upload metadata
+        publish: Whether the deposition is published
+        
+    Returns:
+        Hex digest identifying the upload
+    """
+    content = {
+        'files': [[info.path.name, info.size, info.mtime_ns] for info in file_infos],
+        'metadata': metadata,
+        'publish': publish
+    }
+    raw = json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()
+
+
+class UploadCache:
+    """
+    Remembers the deposition each upload produced, keyed by its content
+    
+    Repeating an identical upload (see _upload_key) can then return the
+    existing deposition instead of transferring the files again. Entries are
+    persisted in uploads_cache.json in the user config directory.
+    """
+    
+    def __init__(self, file_path: Optional[Path] = None):
+        """
+        Initialize upload cache
+        
+        Args:
+            file_path: JSON file backing the cache (defaults to
+                uploads_cache.json in the user config directory)
+        """
+        self.file_path = file_path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the entry stored for key, if any"""
+        with self._lock:
+            entry = self._load().get(key)
+            return dict(entry) if entry is not None else None
+    
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry for key"""
+        with self._lock:
+            entries = self._load()
+            entries.pop(key, None)
+            entries[key] = entry
+            while len(entries) > UPLOAD_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+            self._save()
+    
+    def discard(self, key: str) -> None:
+        """Forget the entry for key"""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._save()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the entries on first use (caller holds the lock)"""
+        if self._entries is None:
+            if self.file_path is None:
+                self.file_path = get_uploads_cache_path()
+            self._entries = load_json_config(self.file_path, {})
+        return self._entries
+    
+    def _save(self) -> None:
+        """Persist the entries (caller holds the lock)"""
+        save_json_config(self.file_path, self._entries)
+
+
+class ResumeLedger:
+    """
+    Records the draft deposition of uploads that have not finished yet
+    
+    Persisted in uploads_resume.json in the user config directory as::
+    
+        {<upload key>: {"deposition_id": int,
+                        "timestamp": float,   # time.time() the draft was created
+                        "files": {<filename>: <md5 hex>}}}
+    
+    where "files" lists the files whose upload Zenodo confirmed with a
+    matching checksum. Repeating a failed upload continues its draft and
+    only sends the files not listed there. The bucket API stores whole
+    files only, so uploads resume per file, not per byte.
+    """
+    
+    def __init__(self, file_path: Optional[Path] = None):
+        """
+        Initialize resume ledger
+        
+        Args:
+            file_path: JSON file backing the ledger (defaults to
+                uploads_resume.json in the user config directory)
+        """
+        self.file_path = file_path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the entry recorded for key, if any"""
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return None
+            return {**entry, 'files': dict(entry.get('files', {}))}
+    
+    def start(self, key: str, deposition_id: int) -> None:
+        """Record the draft deposition created for an upload"""
+        with self._lock:
+            self._load()[key] = {'deposition_id': deposition_id, 'timestamp': time.time(), 'files': {}}
+            self._save()
+    
+    def record_file(self, key: str, filename: str, md5: str) -> None:
+        """Record a file whose upload was verified"""
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None:
+                entry.setdefault('files', {})[filename] = md5
+                self._save()
+    
+    def discard(self, key: str) -> None:
+        """Forget the entry for key"""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._save()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the entries on first use (caller holds the lock)"""
+        if self._entries is None:
+            if self.file_path is None:
+                self.file_path = get_uploads_resume_path()
+            self._entries = load_json_config(self.file_path, {})
+        return self._entries
+    
+    def _save(self) -> None:
+        """Persist the entries (caller holds the lock)"""
+        save_json_config(self.file_path, self._entries)
+
+
 class UploadManager(UploadService):
     """
     Manages the complete upload workflow
@@ -39,7 +283,10 @@ class UploadManager(UploadService):
     def __init__(self, 
                  repository_api: RepositoryAPI,
                  file_validator: FileValidator,
-                 metadata_validator: MetadataValidator):
+                 metadata_validator: MetadataValidator,
+                 progress_update_interval_s: float = PROGRESS_UPDATE_INTERVAL_S,
+                 upload_cache: Optional[UploadCache] = None,
+                 resume_ledger: Optional[ResumeLedger] = None):
         """
         Initialize upload manager
         
@@ -47,18 +294,44 @@ class UploadManager(UploadService):
             repository_api: API for repository interactions
             file_validator: File validation service
             metadata_validator: Metadata validation service
+            progress_update_interval_s: Minimum seconds between progress
+                callbacks (0 to report every change)
+            upload_cache: Optional cache of previous uploads; identical
+                uploads then return the existing deposition. Off by default,
+                since a user may deliberately upload the same files again
+            resume_ledger: Optional record of unfinished uploads; repeating
+                a failed one continues its draft deposition, skipping the
+                files already uploaded. Off by default
         """
         self.repository_api = repository_api
         self.file_validator = file_validator
         self.metadata_validator = metadata_validator
+        self.progress_update_interval_s = progress_update_interval_s
+        self.upload_cache = upload_cache
+        self.resume_ledger = resume_ledger
+        # Ledger key of the running upload (forgotten when it is cancelled)
+        self._resume_key: Optional[str] = None
         
         self._status = UploadStatus.IDLE
-        self._cancel_requested = False
-        self._upload_thread: Optional[threading.Thread] = None
+        # Set by cancel_upload; an Event so the upload thread and progress
+        # callbacks can poll it without taking the lock
+        self._cancel_event = threading.Event()
+        # Stops all files of a parallel multi-file upload; set on cancel or
+        # when one of its files fails
+        self._batch_stop: Optional[threading.Event] = None
         self._current_deposition_id: Optional[int] = None
         
+        # Worker for upload_async, created on first use; uploads run one at a
+        # time, so a single reused thread is enough
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._async_future: Optional[Future] = None
+        
         # Thread safety
         self._lock = threading.Lock()
+        
+        # Reporter of the current (or last) upload; also holds the progress
+        # snapshot for consumers that poll instead of receiving callbacks
+        self._reporter = StatusReporter()
     
     def upload(self, 
                metadata: Dict[str, Any], 
@@ -87,17 +360,21 @@ class UploadManager(UploadService):
                 raise UploadError("Upload already in progress")
             
             self._status = UploadStatus.VALIDATING
-            self._cancel_requested = False
+            self._cancel_event.clear()
             self._current_deposition_id = None
+            reporter = StatusReporter(
+                progress_callback, status_callback, self._cancel_event,
+                self.progress_update_interval_s
+            )
+            self._reporter = reporter
         
         try:
-            return self._perform_upload(
-                metadata, file_path, publish, 
-                progress_callback, status_callback
-            )
+            return self._perform_upload(metadata, file_path, publish, reporter)
         except Exception as e:
             with self._lock:
                 self._status = UploadStatus.FAILED
+            if self._cancel_event.is_set():
+                self._forget_resume_entry()
             raise UploadError(f"Upload failed: {str(e)}") from e
         finally:
             with self._lock:
@@ -110,7 +387,7 @@ class UploadManager(UploadService):
                      publish: bool = False,
                      progress_callback: Optional[ProgressCallback] = None,
                      status_callback: Optional[StatusCallback] = None,
-                     completion_callback: Optional[Callable[[bool, Any], None]] = None) -> None:
+                     completion_callback: Optional[Callable[[bool, Any], None]] = None) -> Future:
         """
         Upload a file asynchronously
         
@@ -121,25 +398,93 @@ class UploadManager(UploadService):
             progress_callback: Optional progress reporting callback
             status_callback: Optional status update callback
             completion_callback: Callback for completion (success: bool, result: Any)
+            
+        Returns:
+            Future resolving to the upload result dictionary
         """
-        def upload_worker():
-            try:
-                result = self.upload(
-                    metadata, file_path, publish,
-                    progress_callback, status_callback
-                )
-                if completion_callback:
-                    completion_callback(True, result)
-            except Exception as e:
-                if completion_callback:
-                    completion_callback(False, e)
-        
         with self._lock:
-            if self._upload_thread and self._upload_thread.is_alive():
+            if self._async_future is not None and not self._async_future.done():
                 raise UploadError("Upload already in progress")
             
-            self._upload_thread = threading.Thread(target=upload_worker, daemon=True)
-            self._upload_thread.start()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zedd-upload")
+            future = self._executor.submit(
+                self.upload, metadata, file_path, publish,
+                progress_callback, status_callback
+            )
+            self._async_future = future
+        
+        if completion_callback:
+            def on_done(done: Future) -> None:
+                if done.cancelled():
+                    return
+                error = done.exception()
+                if error is None:
+                    completion_callback(True, done.result())
+                else:
+                    completion_callback(False, error)
+            
+            future.add_done_callback(on_done)
+        
+        return future
+    
+    async def upload_async_io(self,
+                              metadata: Dict[str, Any],
+                              file_path: str,
+                              publish: bool = False,
+                              progress_callback: Optional[ProgressCallback] = None,
+                              status_callback: Optional[StatusCallback] = None) -> Dict[str, Any]:
+        """
+        Upload a file from a coroutine
+        
+        The upload runs on the upload_async worker; the callbacks are invoked
+        on the calling event loop's thread. Cancelling the awaiting task
+        cancels the upload.
+        
+        Args:
+            metadata: Upload metadata
+            file_path: Path to file to upload
+            publish: Whether to publish immediately
+            progress_callback: Optional progress reporting callback
+            status_callback: Optional status update callback
+            
+        Returns:
+            Upload result dictionary
+            
+        Raises:
+            UploadError: If upload fails
+        """
+        loop = asyncio.get_running_loop()
+        
+        def on_loop(callback):
+            if callback is None:
+                return None
+            return lambda value: loop.call_soon_threadsafe(callback, value)
+        
+        future = self.upload_async(
+            metadata, file_path, publish,
+            on_loop(progress_callback), on_loop(status_callback)
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            self.cancel_upload()
+            raise
+    
+    def close(self, wait: bool = True) -> None:
+        """
+        Release the upload_async worker, cancelling a queued upload
+        
+        The worker thread is joined at interpreter exit, so cancel a running
+        upload first when shutting down.
+        
+        Args:
+            wait: Whether to wait for a running upload to return
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
     
     def cancel_upload(self) -> None:
         """Cancel any ongoing upload operation"""
@@ -147,7 +492,9 @@ class UploadManager(UploadService):
             if self._status == UploadStatus.IDLE:
                 return
             
-            self._cancel_requested = True
+            self._cancel_event.set()
+            if self._batch_stop is not None:
+                self._batch_stop.set()
             self._status = UploadStatus.CANCELLED
     
     def is_uploading(self) -> bool:
@@ -161,12 +508,15 @@ class UploadManager(UploadService):
         with self._lock:
             return self._status
     
+    def get_progress_state(self) -> tuple[int, str]:
+        """Get the latest (percentage, status message) of the current upload"""
+        return self._reporter.state()
+    
     def _perform_upload(self,
                         metadata: Dict[str, Any], 
                         file_path: str,
                         publish: bool,
-                        progress_callback: Optional[ProgressCallback],
-                        status_callback: Optional[StatusCallback]) -> Dict[str, Any]:
+                        reporter: StatusReporter) -> Dict[str, Any]:
         """Perform the actual upload workflow (supports multiple files separated by semicolons)"""
         
         # Parse file paths (support multiple files separated by semicolon)
@@ -175,22 +525,27 @@ class UploadManager(UploadService):
             raise UploadError("No valid file paths provided")
         
         # Step 1: Validate files (5%)
-        self._update_status(status_callback, f"Validating {len(file_paths)} file(s)...")
-        self._update_progress(progress_callback, 5)
+        reporter.status(f"Validating {len(file_paths)} file(s)...")
+        reporter.progress(5)
         
-        if self._cancel_requested:
+        if self._cancel_event.is_set():
             return self._handle_cancellation()
         
+        # Each file is examined once here; the resulting FileInfo is what gets
+        # uploaded (its MD5 is computed while streaming and checked against
+        # Zenodo's)
+        file_infos = []
         for fp in file_paths:
-            file_valid, file_error = self.file_validator.validate(fp)
-            if not file_valid:
+            file_info, file_error = self.file_validator.validate_and_describe(fp)
+            if file_info is None:
                 raise UploadError(f"File validation failed for '{Path(fp).name}': {file_error}")
+            file_infos.append(file_info)
         
         # Step 2: Validate metadata (10%)
-        self._update_status(status_callback, "Validating metadata...")
-        self._update_progress(progress_callback, 10)
+        reporter.status("Validating metadata...")
+        reporter.progress(10)
         
-        if self._cancel_requested:
+        if self._cancel_event.is_set():
             return self._handle_cancellation()
         
         metadata_valid, metadata_errors = self.metadata_validator.validate(metadata)
@@ -198,75 +553,165 @@ class UploadManager(UploadService):
             error_msg = "Metadata validation failed:\n" + "\n".join(metadata_errors)
             raise UploadError(error_msg)
         
-        # Step 3: Create deposition (20%)
+        cache_key = None
+        if self.upload_cache is not None or self.resume_ledger is not None:
+            cache_key = _upload_key(file_infos, metadata, publish)
+        
+        # Identical upload done before: return its deposition if it still exists
+        if self.upload_cache is not None:
+            cached = self._lookup_cached_upload(cache_key, file_infos, reporter)
+            if cached is not None:
+                return cached
+        
+        # Step 3: Create deposition (20%), or continue the draft of an
+        # interrupted identical upload
         with self._lock:
             self._status = UploadStatus.CREATING_DEPOSITION
         
-        self._update_status(status_callback, "Creating deposition...")
-        self._update_progress(progress_callback, 20)
+        deposition = None
+        uploaded_files = {}
+        if self.resume_ledger is not None:
+            self._resume_key = cache_key
+            deposition, uploaded_files = self._lookup_interrupted_upload(cache_key, reporter)
         
-        if self._cancel_requested:
+        if deposition is None:
+            reporter.status("Creating deposition...")
+        reporter.progress(20)
+        
+        if self._cancel_event.is_set():
             return self._handle_cancellation()
         
-        deposition = self.repository_api.create_deposition(metadata)
+        if deposition is None:
+            deposition = self.repository_api.create_deposition(metadata)
+            if self.resume_ledger is not None:
+                self.resume_ledger.start(cache_key, deposition['id'])
         deposition_id = deposition['id']
         
-        with self._lock:
-            self._current_deposition_id = deposition_id
+        # Files already in a resumed deposition are not sent again
+        pending_infos = [info for info in file_infos if info.path.name not in uploaded_files]
+        if len(pending_infos) < len(file_infos):
+            reporter.status(
+                f"Resuming deposition {deposition_id}: "
+                f"{len(file_infos) - len(pending_infos)}/{len(file_infos)} file(s) already uploaded"
+            )
         
         # Step 4: Upload files (20-85%)
         with self._lock:
+            self._current_deposition_id = deposition_id
             self._status = UploadStatus.UPLOADING
         
-        total_files = len(file_paths)
-        upload_progress_per_file = 65 / total_files  # 65% total for all file uploads
+        total_files = len(pending_infos)
+        upload_progress_per_file = 65 / max(total_files, 1)  # 65% total for all file uploads
+        
+        # Lets the API check for cancellation between chunks and stop waiting
+        # between retries as soon as the upload is cancelled
+        cancel_checker = self._cancel_event
         
-        for file_idx, fp in enumerate(file_paths):
-            filename = Path(fp).name
-            self._update_status(status_callback, f"Uploading file {file_idx + 1}/{total_files}: {filename}...")
+        if total_files == 1:
+            file_info = pending_infos[0]
+            reporter.status(f"Uploading file 1/1: {file_info.path.name}...")
             
             def file_upload_progress_callback(percentage: int):
-                """Map individual file upload progress to overall progress"""
-                if self._cancel_requested:
-                    return
-                # Calculate overall progress for this file
-                base_progress = 20 + int(file_idx * upload_progress_per_file)
-                file_progress = int((percentage * upload_progress_per_file) / 100)
-                overall_progress = base_progress + file_progress
-                self._update_progress(progress_callback, overall_progress)
+                """Map file upload progress to overall progress"""
+                reporter.progress(20 + int(percentage * upload_progress_per_file / 100))
             
-            def cancel_checker() -> bool:
-                """Check if upload has been cancelled"""
-                return self._cancel_requested
-            
-            if self._cancel_requested:
+            if self._cancel_event.is_set():
                 return self._handle_cancellation()
             
             file_result = self.repository_api.upload_file(
-                deposition_id, fp, file_upload_progress_callback, cancel_checker
+                deposition_id, file_info, file_upload_progress_callback, cancel_checker
             )
+            self._record_uploaded_file(cache_key, file_info, file_result)
+        elif total_files > 1:
+            # Files go into the same bucket independently, so upload them in parallel
+            # and report the combined progress of all files
+            file_progress = [0] * total_files
+            progress_lock = threading.Lock()
+            batch_stop = threading.Event()
+            with self._lock:
+                self._batch_stop = batch_stop
+                if self._cancel_event.is_set():
+                    batch_stop.set()
+            
+            def upload_one(file_idx: int) -> Dict[str, Any]:
+                def file_upload_progress_callback(percentage: int):
+                    """Map individual file upload progress to overall progress"""
+                    if self._cancel_event.is_set():
+                        return
+                    with progress_lock:
+                        file_progress[file_idx] = percentage
+                        overall_progress = 20 + int(sum(file_progress) * upload_progress_per_file / 100)
+                    reporter.progress(overall_progress)
+                
+                if batch_stop.is_set():
+                    raise UploadError("Upload cancelled by user")
+                file_info = pending_infos[file_idx]
+                file_result = self.repository_api.upload_file(
+                    deposition_id, file_info, file_upload_progress_callback, batch_stop
+                )
+                self._record_uploaded_file(cache_key, file_info, file_result)
+                return file_result
+            
+            if self._cancel_event.is_set():
+                return self._handle_cancellation()
+            
+            reporter.status(f"Uploading {total_files} files...")
+            
+            try:
+                with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_UPLOADS, total_files)) as executor:
+                    futures = [executor.submit(upload_one, idx) for idx in range(total_files)]
+                    completed = 0
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                            completed += 1
+                            reporter.status(f"Uploaded {completed}/{total_files} files")
+                    except Exception:
+                        # Once one file has failed, stop the uploads in flight
+                        # and don't start those still queued
+                        batch_stop.set()
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                with self._lock:
+                    self._batch_stop = None
+            
+            if self._cancel_event.is_set():
+                return self._handle_cancellation()
         
         # Step 5: Publish if requested (85-100%)
         if publish:
             with self._lock:
                 self._status = UploadStatus.PUBLISHING
             
-            self._update_status(status_callback, "Publishing deposition...")
-            self._update_progress(progress_callback, 90)
+            reporter.status("Publishing deposition...")
+            reporter.progress(90)
             
-            if self._cancel_requested:
+            if self._cancel_event.is_set():
                 return self._handle_cancellation()
             
             result = self.repository_api.publish_deposition(deposition_id)
             
-            self._update_progress(progress_callback, 100)
+            reporter.progress(100)
             files_msg = f"{len(file_paths)} file(s)" if len(file_paths) > 1 else "file"
-            self._update_status(status_callback, f"Upload of {files_msg} completed and published!")
+            reporter.status(f"Upload of {files_msg} completed and published!")
         else:
             result = deposition
-            self._update_progress(progress_callback, 100)
+            reporter.progress(100)
             files_msg = f"{len(file_paths)} file(s)" if len(file_paths) > 1 else "file"
-            self._update_status(status_callback, f"Upload of {files_msg} completed (draft)!")
+            reporter.status(f"Upload of {files_msg} completed (draft)!")
+        
+        if self.resume_ledger is not None:
+            self.resume_ledger.discard(cache_key)
+            self._resume_key = None
+        if self.upload_cache is not None:
+            self.upload_cache.put(cache_key, {
+                'deposition_id': deposition_id,
+                'url': result.get('links', {}).get('html', ''),
+                'size': sum(info.size for info in file_infos),
+                'timestamp': time.time()
+            })
         
         # Mark as completed
         with self._lock:
@@ -275,43 +720,139 @@ class UploadManager(UploadService):
         
         return result
     
+    def _lookup_interrupted_upload(self, cache_key: str,
+                                   reporter: StatusReporter) -> tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """
+        Get the draft deposition of an identical upload that did not finish
+        
+        A file counts as uploaded only if it was recorded as verified in the
+        ledger and the draft still holds it with that checksum. The entry is
+        dropped if the deposition is gone or no longer a draft.
+        
+        Args:
+            cache_key: Key of this upload
+            reporter: Status reporter of this upload
+            
+        Returns:
+            Tuple of (deposition, {filename: md5} of files already uploaded),
+            or (None, {}) to start a new deposition
+        """
+        entry = self.resume_ledger.get(cache_key)
+        if entry is None:
+            return None, {}
+        
+        deposition_id = entry.get('deposition_id')
+        reporter.status(f"Checking interrupted upload (deposition {deposition_id})...")
+        try:
+            deposition = self.repository_api.get_deposition(deposition_id)
+        except APIError:
+            deposition = None
+        
+        if deposition is None or deposition.get('submitted'):
+            self.resume_ledger.discard(cache_key)
+            return None, {}
+        
+        held = {
+            f.get('filename', ''): f.get('checksum', '').removeprefix('md5:')
+            for f in deposition.get('files', [])
+        }
+        uploaded_files = {
+            name: md5 for name, md5 in entry['files'].items() if held.get(name) == md5
+        }
+        return deposition, uploaded_files
+    
+    def _record_uploaded_file(self, cache_key: Optional[str], file_info: FileInfo,
+                              file_result: Dict[str, Any]) -> None:
+        """Record a verified file upload in the resume ledger"""
+        if self.resume_ledger is None:
+            return
+        checksum = (file_result or {}).get('checksum') or ''
+        if checksum.startswith('md5:'):
+            self.resume_ledger.record_file(cache_key, file_info.path.name, checksum[4:])
+    
+    def _forget_resume_entry(self) -> None:
+        """Drop the resume ledger entry of the running upload"""
+        key, self._resume_key = self._resume_key, None
+        if self.resume_ledger is not None and key is not None:
+            self.resume_ledger.discard(key)
+    
+    def _lookup_cached_upload(self, cache_key: str, file_infos: List[FileInfo],
+                              reporter: StatusReporter) -> Optional[Dict[str, Any]]:
+        """
+        Get the deposition of an identical earlier upload
+        
+        The entry is only used if the deposition can still be fetched and
+        holds files with the expected names and sizes; otherwise it is dropped.
+        
+        Args:
+            cache_key: Cache key of this upload
+            file_infos: Files of this upload
+            reporter: Status reporter of this upload
+            
+        Returns:
+            The current state of the deposition, or None to upload normally
+        """
+        entry = self.upload_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        deposition_id = entry.get('deposition_id')
+        reporter.status(f"Checking previous upload (deposition {deposition_id})...")
+        try:
+            deposition = self.repository_api.get_deposition(deposition_id)
+        except APIError:
+            deposition = None
+        
+        stored = {(f.get('filename', ''), f.get('filesize')) for f in (deposition or {}).get('files', [])}
+        if deposition is None or not all((info.path.name, info.size) in stored for info in file_infos):
+            self.upload_cache.discard(cache_key)
+            return None
+        
+        reporter.progress(100)
+        reporter.status(f"Files already uploaded to deposition {deposition_id}; nothing to do")
+        with self._lock:
+            self._status = UploadStatus.COMPLETED
+        return deposition
+    
     def _handle_cancellation(self) -> Dict[str, Any]:
         """Handle upload cancellation"""
         with self._lock:
             self._status = UploadStatus.CANCELLED
             # Note: We could add cleanup logic here (e.g., delete incomplete deposition)
             self._current_deposition_id = None
+        # A cancelled upload is not resumed
+        self._forget_resume_entry()
         
         raise UploadError("Upload cancelled by user")
-    
-    def _update_progress(self, callback: Optional[ProgressCallback], percentage: int) -> None:
-        """Safely update progress"""
-        if callback and not self._cancel_requested:
-            try:
-                callback(percentage)
-            except Exception:
-                pass  # Don't let callback errors break the upload
-    
-    def _update_status(self, callback: Optional[StatusCallback], message: str) -> None:
-        """Safely update status"""
-        if callback and not self._cancel_requested:
-            try:
-                callback(message)
-            except Exception:
-                pass  # Don't let callback errors break the upload
 
 
 class BatchUploadManager:
     """Manages uploading multiple files as separate depositions"""
     
-    def __init__(self, upload_manager: UploadManager):
+    def __init__(self, upload_manager: UploadManager, max_workers: int = MAX_PARALLEL_UPLOADS,
+                 progress_update_interval_s: float = PROGRESS_UPDATE_INTERVAL_S):
         """
         Initialize batch upload manager
         
         Args:
-            upload_manager: Single file upload manager
+            upload_manager: Single file upload manager (its API and validators
+                are shared by the per-file upload managers)
+            max_workers: Maximum number of depositions uploaded concurrently
+            progress_update_interval_s: Minimum seconds between overall
+                progress callbacks (0 to report every change)
         """
         self.upload_manager = upload_manager
+        self.max_workers = max_workers
+        self.progress_update_interval_s = progress_update_interval_s
+        
+        # Created on first use and reused across upload_multiple calls
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # Set by cancel; per-file managers of the running batch
+        self._cancel_event = threading.Event()
+        self._active: set[UploadManager] = set()
+        self._active_lock = threading.Lock()
     
     def upload_multiple(self,
                         files_and_metadata: list[tuple[str, Dict[str, Any]]],
@@ -321,6 +862,10 @@ class BatchUploadManager:
         """
         Upload multiple files
         
+        Depositions are independent, so files are uploaded concurrently, each
+        through its own UploadManager (an UploadManager runs one upload at a
+        time).
+        
         Args:
             files_and_metadata: List of (file_path, metadata) tuples
             publish: Whether to publish all depositions
@@ -328,56 +873,114 @@ class BatchUploadManager:
             status_callback: Status update callback
             
         Returns:
-            List of upload results
+            List of upload results, in the order of files_and_metadata
         """
-        results = []
         total_files = len(files_and_metadata)
+        results: list[Optional[Dict[str, Any]]] = [None] * total_files
+        self._cancel_event.clear()
+        reporter = StatusReporter(
+            progress_callback, status_callback,
+            interval_s=self.progress_update_interval_s
+        )
+        
+        # Per-file progress, combined into the overall percentage
+        file_progress = [0] * total_files
+        progress_lock = threading.Lock()
+        
+        def set_file_progress(index: int, file_percentage: int) -> None:
+            with progress_lock:
+                file_progress[index] = file_percentage
+                overall_percentage = int(sum(file_progress) / total_files)
+            reporter.progress(overall_percentage)
         
-        for i, (file_path, metadata) in enumerate(files_and_metadata):
-            file_name = Path(file_path).name
+        def upload_one(index: int) -> Dict[str, Any]:
+            if self._cancel_event.is_set():
+                raise UploadError("Upload cancelled by user")
+            file_path, metadata = files_and_metadata[index]
+            reporter.status(
+                f"Uploading file {index+1}/{total_files}: {Path(file_path).name}"
+            )
             
-            # Update overall status
-            self._update_status(
-                status_callback, 
-                f"Uploading file {i+1}/{total_files}: {file_name}"
+            upload_manager = UploadManager(
+                repository_api=self.upload_manager.repository_api,
+                file_validator=self.upload_manager.file_validator,
+                metadata_validator=self.upload_manager.metadata_validator,
+                progress_update_interval_s=self.progress_update_interval_s,
+                upload_cache=self.upload_manager.upload_cache,
+                resume_ledger=self.upload_manager.resume_ledger
             )
             
-            # Calculate overall progress
-            def file_progress_callback(file_percentage: int):
-                overall_percentage = int(((i * 100) + file_percentage) / total_files)
-                self._update_progress(progress_callback, overall_percentage)
+            def on_file_progress(file_percentage: int) -> None:
+                if self._cancel_event.is_set():
+                    # cancel() ran before this upload had started
+                    upload_manager.cancel_upload()
+                    return
+                set_file_progress(index, file_percentage)
             
+            with self._active_lock:
+                self._active.add(upload_manager)
             try:
-                result = self.upload_manager.upload(
+                return upload_manager.upload(
                     metadata, file_path, publish,
-                    file_progress_callback, None  # Use our own status updates
+                    on_file_progress,
+                    None  # Use our own status updates
                 )
-                results.append(result)
-            except Exception as e:
-                # Continue with other files, but record the error
-                results.append({
-                    'error': str(e),
-                    'file_path': file_path,
-                    'failed': True
-                })
-        
-        self._update_progress(progress_callback, 100)
-        self._update_status(status_callback, f"Completed uploading {total_files} files")
+            finally:
+                with self._active_lock:
+                    self._active.discard(upload_manager)
+        
+        if total_files:
+            executor = self._get_executor()
+            future_to_index = {
+                executor.submit(upload_one, index): index for index in range(total_files)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    # Continue with other files, but record the error
+                    results[index] = {
+                        'error': str(e),
+                        'file_path': files_and_metadata[index][0],
+                        'failed': True
+                    }
+                    set_file_progress(index, 100)
+        
+        reporter.progress(100)
+        if self._cancel_event.is_set():
+            reporter.status("Batch upload cancelled")
+        else:
+            reporter.status(f"Completed uploading {total_files} files")
         
         return results
     
-    def _update_progress(self, callback: Optional[ProgressCallback], percentage: int) -> None:
-        """Safely update progress"""
-        if callback:
-            try:
-                callback(percentage)
-            except Exception:
-                pass
+    def cancel(self) -> None:
+        """Cancel the running upload_multiple: stop active uploads and skip queued ones"""
+        self._cancel_event.set()
+        with self._active_lock:
+            upload_managers = list(self._active)
+        for upload_manager in upload_managers:
+            upload_manager.cancel_upload()
     
-    def _update_status(self, callback: Optional[StatusCallback], message: str) -> None:
-        """Safely update status"""
-        if callback:
-            try:
-                callback(message)
-            except Exception:
-                pass
\ No newline at end of file
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Release the worker threads
+        
+        Args:
+            wait: Whether to wait for running uploads to finish
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared upload thread pool, creating it on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="zedd-batch-upload"
+                )
+            return self._executor
\ No newline at end of file
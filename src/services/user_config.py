@@ -14,21 +14,78 @@ Directory structure:
     ├── settings.json           # GUI state and preferences
     ├── tokens.json             # API tokens (sandbox & production)
     ├── user_template.json      # User's custom metadata template (optional)
-    └── cif_mappings.json       # User's custom CIF mappings (optional)
+    ├── cif_mappings.json       # User's custom CIF mappings (optional)
+    ├── uploads_cache.json      # Depositions of previous uploads, by content
+    └── uploads_resume.json     # Draft depositions of interrupted uploads, by content
 """
 
+import hashlib
 import json
+import logging
 import os
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    # Optional faster JSON encoder/decoder; falls back to the standard library
+    import orjson
+except ImportError:
+    orjson = None
 
+logger = logging.getLogger(__name__)
+
+
+def encode_json(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes indented by 2 spaces
+    
+    orjson and the standard library fallback produce the same bytes, so
+    every JSON file ZEDD writes has the same layout either way.
+    
+    Args:
+        data: Dictionary to serialize (non-string keys are converted)
+    
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+# The platform never changes while running, so pick its implementation once
+if sys.platform == 'win32':
+    def _compute_config_directory() -> Path:
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+        return Path(base) / 'ZEDD'
+elif sys.platform == 'darwin':
+    def _compute_config_directory() -> Path:
+        return Path.home() / 'Library' / 'Application Support' / 'ZEDD'
+else:
+    # Linux and other Unix-like systems
+    def _compute_config_directory() -> Path:
+        xdg_config = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+        return Path(xdg_config) / 'ZEDD'
+
+
+@lru_cache(maxsize=1)
 def get_user_config_directory() -> Path:
     """
     Get the ZEDD user configuration directory path.
     
-    This is the root directory for all user-specific data.
+    This is the root directory for all user-specific data. The result is
+    cached for the process; call cache_clear() on it and on the get_*_path
+    helpers after changing APPDATA / XDG_CONFIG_HOME at runtime.
     
     Returns:
         Path to the configuration directory:
@@ -36,15 +93,7 @@ def get_user_config_directory() -> Path:
         - macOS: ~/Library/Application Support/ZEDD
         - Linux: ~/.config/ZEDD
     """
-    if sys.platform == 'win32':
-        base = os.environ.get('APPDATA', os.path.expanduser('~'))
-        return Path(base) / 'ZEDD'
-    elif sys.platform == 'darwin':
-        return Path.home() / 'Library' / 'Application Support' / 'ZEDD'
-    else:
-        # Linux and other Unix-like systems
-        xdg_config = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
-        return Path(xdg_config) / 'ZEDD'
+    return _compute_config_directory()
 
 
 def ensure_user_config_directory() -> Path:
@@ -59,6 +108,7 @@ def ensure_user_config_directory() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_settings_file_path() -> Path:
     """
     Get the path to the settings JSON file.
@@ -66,9 +116,10 @@ def get_settings_file_path() -> Path:
     Returns:
         Path to settings.json in the config directory
     """
-    return ensure_user_config_directory() / 'settings.json'
+    return get_user_config_directory() / 'settings.json'
 
 
+@lru_cache(maxsize=1)
 def get_user_template_path() -> Path:
     """
     Get the path to the user's custom metadata template.
@@ -76,9 +127,10 @@ def get_user_template_path() -> Path:
     Returns:
         Path to user_template.json in the config directory
     """
-    return ensure_user_config_directory() / 'user_template.json'
+    return get_user_config_directory() / 'user_template.json'
 
 
+@lru_cache(maxsize=1)
 def get_user_cif_mappings_path() -> Path:
     """
     Get the path to the user's custom CIF mappings.
@@ -86,9 +138,10 @@ def get_user_cif_mappings_path() -> Path:
     Returns:
         Path to cif_mappings.json in the config directory
     """
-    return ensure_user_config_directory() / 'cif_mappings.json'
+    return get_user_config_directory() / 'cif_mappings.json'
 
 
+@lru_cache(maxsize=1)
 def get_tokens_file_path() -> Path:
     """
     Get the path to the tokens JSON file.
@@ -96,7 +149,29 @@ def get_tokens_file_path() -> Path:
     Returns:
         Path to tokens.json in the config directory
     """
-    return ensure_user_config_directory() / 'tokens.json'
+    return get_user_config_directory() / 'tokens.json'
+
+
+@lru_cache(maxsize=1)
+def get_uploads_cache_path() -> Path:
+    """
+    Get the path to the uploads cache JSON file.
+    
+    Returns:
+        Path to uploads_cache.json in the config directory
+    """
+    return get_user_config_directory() / 'uploads_cache.json'
+
+
+@lru_cache(maxsize=1)
+def get_uploads_resume_path() -> Path:
+    """
+    Get the path to the interrupted uploads JSON file.
+    
+    Returns:
+        Path to uploads_resume.json in the config directory
+    """
+    return get_user_config_directory() / 'uploads_resume.json'
 
 
 def load_json_config(file_path: Path, default: Optional[Dict] = None) -> Dict[str, Any]:
@@ -115,14 +190,18 @@ def load_json_config(file_path: Path, default: Optional[Dict] = None) -> Dict[st
     
     try:
         if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _loads(file_path.read_bytes())
     except Exception as e:
-        print(f"Warning: Could not load {file_path}: {e}")
+        logger.warning("Could not load %s: %s", file_path, e)
     
     return default
 
 
+# (digest, mtime_ns) of the bytes last written to each config file by
+# save_json_config, keyed by resolved path so aliases of a file share an entry
+_saved_digests: Dict[Path, tuple] = {}
+
+
 def save_json_config(file_path: Path, data: Dict[str, Any]) -> bool:
     """
     Save a dictionary as JSON configuration file.
@@ -134,13 +213,41 @@ def save_json_config(file_path: Path, data: Dict[str, Any]) -> bool:
     Returns:
         True if save succeeded, False otherwise
     """
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
     try:
-        ensure_user_config_directory()
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        raw = encode_json(data)
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        
+        # Skip rewriting a file whose content would not change (unless it was
+        # modified or removed since we wrote it)
+        key = file_path.resolve()
+        saved = _saved_digests.get(key)
+        if saved is not None and saved[0] == digest:
+            try:
+                if os.stat(file_path).st_mtime_ns == saved[1]:
+                    return True
+            except OSError:
+                pass
+        
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and swap it in, so an interrupted save
+        # never leaves a truncated config file behind
+        tmp_path.write_bytes(raw)
+        try:
+            # Keep the permissions of the file being replaced (e.g. a
+            # tokens.json the user made private)
+            shutil.copymode(file_path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, file_path)
+        _saved_digests[key] = (digest, os.stat(file_path).st_mtime_ns)
         return True
     except Exception as e:
-        print(f"Warning: Could not save {file_path}: {e}")
+        logger.warning("Could not save %s: %s", file_path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 
@@ -221,6 +328,17 @@ def get_bundled_resource_path(relative_path: str) -> Path:
     return base_path / relative_path
 
 
+if sys.platform == 'win32':
+    def _open_directory(path: Path) -> None:
+        os.startfile(str(path))
+else:
+    _OPEN_COMMAND = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    
+    def _open_directory(path: Path) -> None:
+        import subprocess
+        subprocess.run([_OPEN_COMMAND, str(path)], check=True)
+
+
 def open_user_config_directory() -> bool:
     """
     Open the user config directory in the system file explorer.
@@ -228,19 +346,9 @@ def open_user_config_directory() -> bool:
     Returns:
         True if successful, False otherwise.
     """
-    import subprocess
-    
     try:
-        config_dir = ensure_user_config_directory()
-        
-        if sys.platform == 'win32':
-            os.startfile(str(config_dir))
-        elif sys.platform == 'darwin':
-            subprocess.run(['open', str(config_dir)], check=True)
-        else:
-            subprocess.run(['xdg-open', str(config_dir)], check=True)
-        
+        _open_directory(ensure_user_config_directory())
         return True
     except Exception as e:
-        print(f"Error opening config directory: {e}")
+        logger.warning("Could not open config directory: %s", e)
         return False
@@ -55,6 +55,7 @@ hiddenimports = [
     'src.gui.app',
     'src.gui.widgets',
     'src.gui.upload_worker',
+    'src.gui.zip_worker',
     'src.gui.template_loader',
     'src.gui.measurement_params',
     'src.gui.multi_column_params',
@@ -70,6 +71,7 @@ hiddenimports = [
     'src.services.cif_parser',
     'src.api.zenodo_api',
     'src.core.interfaces',
+    'src.core.page_cache',
     'src.cli',
 ]
 
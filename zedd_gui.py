@@ -5,6 +5,7 @@ Main entry point for GUI interface
 
 import sys
 import os
+import multiprocessing
 
 # Add the parent directory to Python path to allow imports
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -19,4 +20,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file